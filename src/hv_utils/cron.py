@@ -16,8 +16,12 @@ into explicit integer schedules.
 
 from __future__ import annotations
 
+import re
+from calendar import monthrange, weekday
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Final, NamedTuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -27,7 +31,9 @@ CRON_WEEKDAY_COUNT: Final[int] = 7
 
 EXPECTED_FIELD_COUNT: Final[int] = 5
 SUNDAY_ALIAS_VALUE: Final[int] = 7
-_ONE_MINUTE = timedelta(minutes=1)
+MONTHS_IN_YEAR: Final[int] = 12
+
+type _FieldCursor = tuple[int, int, int, int, int]
 
 FIELD_RANGES = {
     "minutes": tuple(range(60)),
@@ -36,6 +42,9 @@ FIELD_RANGES = {
     "month": tuple(range(1, 13)),
     "day_of_week": tuple(range(SUNDAY_ALIAS_VALUE + 1)),
 }
+_DOM_FULL_MASK: Final[int] = sum(1 << value for value in FIELD_RANGES["day_of_month"])
+# Day-of-week values are stored normalised, so the ``7`` Sunday alias never appears.
+_DOW_FULL_MASK: Final[int] = (1 << CRON_WEEKDAY_COUNT) - 1
 
 DAY_NAME_TO_INDEX = {"SUN": 0, "MON": 1, "TUE": 2, "WED": 3, "THU": 4, "FRI": 5, "SAT": 6}
 MONTH_NAME_TO_INDEX = {
@@ -53,12 +62,18 @@ MONTH_NAME_TO_INDEX = {
     "DEC": 12,
 }
 
+# A cron token is a value, name or ``*``, optionally followed by ``-end`` and ``/step``.
+_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"(\*|[A-Za-z]+|\d+)(?:-([A-Za-z]+|\d+))?(?:/(\d+))?")
+
 
-class CronSchedule(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class CronSchedule:
     """Structured representation of the five cron fields.
 
     Each attribute contains a tuple of integer values that represent the
-    concrete schedule derived from the raw cron expression.
+    concrete schedule derived from the raw cron expression. Each field is
+    mirrored by an integer bitmask (bit ``n`` set when value ``n`` is allowed)
+    that matching and searching use instead of the tuples.
     """
 
     minute: tuple[int, ...]
@@ -66,6 +81,71 @@ class CronSchedule(NamedTuple):
     day_of_month: tuple[int, ...]
     month: tuple[int, ...]
     day_of_week: tuple[int, ...]
+    minute_mask: int = field(init=False, repr=False, compare=False)
+    hour_mask: int = field(init=False, repr=False, compare=False)
+    dom_mask: int = field(init=False, repr=False, compare=False)
+    month_mask: int = field(init=False, repr=False, compare=False)
+    dow_mask: int = field(init=False, repr=False, compare=False)
+    _dom_wild: bool = field(init=False, repr=False, compare=False)
+    _dow_wild: bool = field(init=False, repr=False, compare=False)
+    _dow_span_mask: int = field(init=False, repr=False, compare=False)
+    _time_checks: tuple[tuple[str, int], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Populate bitmasks and wildcard flags from the field tuples."""
+        # Frozen dataclasses only allow initialisation through ``object.__setattr__``.
+        object.__setattr__(self, "minute_mask", _to_mask(self.minute))
+        object.__setattr__(self, "hour_mask", _to_mask(self.hour))
+        object.__setattr__(self, "dom_mask", _to_mask(self.day_of_month))
+        object.__setattr__(self, "month_mask", _to_mask(self.month))
+        object.__setattr__(self, "dow_mask", _to_mask(self.day_of_week))
+        object.__setattr__(self, "_dom_wild", self.dom_mask == _DOM_FULL_MASK)
+        object.__setattr__(self, "_dow_wild", self.dow_mask == _DOW_FULL_MASK)
+        # Repeating the week lets a single bit scan wrap from Saturday to Sunday.
+        object.__setattr__(self, "_dow_span_mask", self.dow_mask | self.dow_mask << CRON_WEEKDAY_COUNT)
+        object.__setattr__(self, "_time_checks", self._build_time_checks())
+
+    def _build_time_checks(self) -> tuple[tuple[str, int], ...]:
+        """Order the minute, hour and month checks by how much each one rejects.
+
+        Unrestricted fields can never reject a datetime and are left out, so
+        ``matches`` tests the most selective field first and stops early.
+
+        Returns:
+            tuple[tuple[str, int], ...]: ``(datetime attribute, bitmask)`` pairs.
+
+        """
+        fields = (
+            ("minute", self.minute_mask, len(FIELD_RANGES["minutes"])),
+            ("hour", self.hour_mask, len(FIELD_RANGES["hours"])),
+            ("month", self.month_mask, len(FIELD_RANGES["month"])),
+        )
+        restricted = [
+            (mask.bit_count() / size, attribute, mask) for attribute, mask, size in fields if mask.bit_count() < size
+        ]
+        return tuple((attribute, mask) for _, attribute, mask in sorted(restricted))
+
+    def _match(self, when: datetime) -> bool:
+        """Test ``when`` against the precomputed masks, most selective field first.
+
+        Returns:
+            bool: True when every restricted field accepts ``when``.
+
+        """
+        for attribute, mask in self._time_checks:
+            if not mask >> getattr(when, attribute) & 1:
+                return False
+        dom_wildcard, dow_wildcard = self._dom_wild, self._dow_wild
+        if dom_wildcard and dow_wildcard:
+            return True
+        dom_match = bool(self.dom_mask >> when.day & 1)
+        if dow_wildcard:
+            return dom_match
+        # ``datetime.weekday`` counts from Monday, cron counts from Sunday.
+        dow_match = bool(self.dow_mask >> (when.weekday() + 1) % CRON_WEEKDAY_COUNT & 1)
+        if dom_wildcard:
+            return dow_match
+        return dom_match or dow_match
 
     @property
     def dom(self) -> tuple[int, ...]:
@@ -93,8 +173,14 @@ class CronSchedule(NamedTuple):
         Returns:
             bool: True when ``when`` satisfies this schedule.
 
+        Raises:
+            TypeError: If ``when`` is not a :class:`datetime` instance.
+
         """
-        return cron_matches(self, when)
+        if not isinstance(when, datetime):
+            message = "when must be a datetime instance."
+            raise TypeError(message)
+        return self._match(when)
 
     def next(self, start: datetime, *, inclusive: bool = False, max_lookahead_days: int = 366) -> datetime:
         """Return the next datetime on or after ``start`` matching this schedule.
@@ -110,17 +196,10 @@ class CronSchedule(NamedTuple):
         Raises:
             ValueError: If no match is found within ``max_lookahead_days``.
 
-        """
+        """  # noqa: DOC502 - ValueError is raised by _next_after
         if inclusive and self.matches(start):
             return start
-        horizon_minutes = max_lookahead_days * 24 * 60
-        current = start
-        for _ in range(horizon_minutes):
-            current += _ONE_MINUTE
-            if self.matches(current):
-                return current
-        message = f"No matching time within {max_lookahead_days} days from {start!r}."
-        raise ValueError(message)
+        return self._next_after(start, max_lookahead_days)
 
     def iter(self, start: datetime, *, inclusive: bool = False, max_lookahead_days: int = 366) -> Iterable[datetime]:
         """Yield successive datetimes that satisfy this schedule.
@@ -134,25 +213,132 @@ class CronSchedule(NamedTuple):
             datetime: Matching datetimes in ascending order.
 
         """
-        current = start
-        first = True
+        current = self.next(start, inclusive=inclusive, max_lookahead_days=max_lookahead_days)
         while True:
-            next_match = self.next(
-                current,
-                inclusive=inclusive if first else False,
-                max_lookahead_days=max_lookahead_days,
-            )
-            yield next_match
-            current = next_match + _ONE_MINUTE
-            first = False
+            yield current
+            current = self._next_after(current, max_lookahead_days)
+
+    def _next_after(self, start: datetime, max_lookahead_days: int) -> datetime:
+        """Return the first matching minute strictly after ``start``.
 
+        Args:
+            start: Datetime to start searching from; its seconds and tzinfo are kept.
+            max_lookahead_days: Maximum days to search before giving up.
+
+        Returns:
+            datetime: The next matching datetime.
+
+        Raises:
+            ValueError: If no match is found within ``max_lookahead_days``.
 
+        """
+        limit = start + timedelta(days=max_lookahead_days)
+        found = self._next_fields(
+            (start.year, start.month, start.day, start.hour, start.minute + 1),
+            (limit.year, limit.month, limit.day, limit.hour, limit.minute),
+        )
+        if found is None:
+            message = f"No matching time within {max_lookahead_days} days from {start!r}."
+            raise ValueError(message)
+        year, month, day, hour, minute = found
+        return start.replace(year=year, month=month, day=day, hour=hour, minute=minute)
+
+    def _next_fields(self, start: _FieldCursor, limit: _FieldCursor) -> _FieldCursor | None:
+        """Find the earliest wall-clock fields on or after ``start`` that satisfy this schedule.
+
+        Instead of probing every minute, each field jumps straight to its next
+        allowed value and carries into the coarser field when it runs out. Fields
+        of ``start`` may overflow (e.g. minute ``60``) and are carried the same way.
+
+        Args:
+            start: ``(year, month, day, hour, minute)`` to start searching from.
+            limit: Latest ``(year, month, day, hour, minute)`` that may be returned.
+
+        Returns:
+            _FieldCursor | None: Matching fields, or None when nothing matches up to ``limit``.
+
+        """
+        # The field tuples are public and need not be sorted, so the smallest allowed values come from the masks.
+        first_minute = _next_bit(self.minute_mask, 0)
+        first_hour = _next_bit(self.hour_mask, 0)
+        first_month = _next_bit(self.month_mask, 0)
+        if first_minute is None or first_hour is None or first_month is None:
+            return None
+        year, month, day, hour, minute = start
+        while (year, month, day, hour, minute) <= limit:
+            next_month = _next_bit(self.month_mask, month)
+            if next_month is None:
+                year, month, day, hour, minute = year + 1, first_month, 1, first_hour, first_minute
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, first_hour, first_minute
+
+            matched_day = self._next_day(year, month, day)
+            if matched_day is None:
+                year, month = (year + 1, 1) if month == MONTHS_IN_YEAR else (year, month + 1)
+                day, hour, minute = 1, first_hour, first_minute
+                continue
+            if matched_day != day:
+                day, hour, minute = matched_day, first_hour, first_minute
+
+            next_hour = _next_bit(self.hour_mask, hour)
+            if next_hour is None:
+                day, hour, minute = day + 1, first_hour, first_minute
+                continue
+            if next_hour != hour:
+                hour, minute = next_hour, first_minute
+
+            next_minute = _next_bit(self.minute_mask, minute)
+            if next_minute is None:
+                hour, minute = hour + 1, first_minute
+                continue
+            found = (year, month, day, hour, next_minute)
+            return found if found <= limit else None
+        return None
+
+    def _next_day(self, year: int, month: int, day: int) -> int | None:
+        """Return the first day of the month on or after ``day`` satisfying the day fields.
+
+        Args:
+            year: Calendar year of the month being searched.
+            month: Month being searched.
+            day: First day of the month to consider.
+
+        Returns:
+            int | None: Matching day of the month, or None if the rest of the month has no match.
+
+        """
+        last_day = monthrange(year, month)[1]
+        if day > last_day:
+            return None
+
+        dom_wildcard = self._dom_wild
+        dow_wildcard = self._dow_wild
+        if dom_wildcard and dow_wildcard:
+            return day
+
+        candidates: list[int] = []
+        if not dom_wildcard and (next_dom := _next_bit(self.dom_mask, day)) is not None:
+            candidates.append(next_dom)
+        if not dow_wildcard:
+            current_weekday = (weekday(year, month, day) + 1) % CRON_WEEKDAY_COUNT
+            next_weekday = _next_bit(self._dow_span_mask, current_weekday)
+            if next_weekday is not None:
+                candidates.append(day + next_weekday - current_weekday)
+
+        matched = min(candidates, default=None)
+        return matched if matched is not None and matched <= last_day else None
+
+
+# Schedules are immutable, so a parsed expression can be shared between callers and threads.
+@lru_cache(maxsize=512)
 def parse_cron(expression: str) -> CronSchedule:
     """Parse a cron expression into explicit field values.
 
     The parser expects the traditional five-field format: minute, hour,
     day of month, month, and day of week. Each field supports single
-    values, ranges, steps (``*/n``), and comma-separated lists.
+    values, ranges, steps (``*/n``), and comma-separated lists. Results are
+    memoized per expression string.
 
     Args:
         expression: Raw cron expression using space-separated fields.
@@ -179,7 +365,7 @@ def parse_cron(expression: str) -> CronSchedule:
                 day_of_week,
                 FIELD_RANGES["day_of_week"],
                 transform_map=DAY_NAME_TO_INDEX,
-                normalizer=_normalize_day_of_week,
+                normalizer=_normalize_day_of_week_mask,
             ),
         )
     except ValueError as exc:
@@ -204,30 +390,9 @@ def cron_matches(expression: str | CronSchedule, when: datetime) -> bool:
     Raises:
         TypeError: If ``when`` is not a :class:`datetime` instance.
 
-    """
-    if not isinstance(when, datetime):
-        message = "when must be a datetime instance."
-        raise TypeError(message)
+    """  # noqa: DOC502 - TypeError is raised by CronSchedule.matches
     schedule = parse_cron(expression) if isinstance(expression, str) else expression
-    minute_ok = when.minute in schedule.minute
-    hour_ok = when.hour in schedule.hour
-    month_ok = when.month in schedule.month
-    if not (minute_ok and hour_ok and month_ok):
-        return False
-
-    dom_wildcard = set(schedule.day_of_month) == set(FIELD_RANGES["day_of_month"])
-    dow_wildcard = set(schedule.day_of_week) == {_normalize_day_of_week(value) for value in FIELD_RANGES["day_of_week"]}
-
-    dom_match = when.day in schedule.day_of_month
-    dow_match = _cron_weekday(when) in schedule.day_of_week
-
-    if dom_wildcard and dow_wildcard:
-        return True
-    if dom_wildcard:
-        return dow_match
-    if dow_wildcard:
-        return dom_match
-    return dom_match or dow_match
+    return schedule.matches(when)
 
 
 def _parse_expression(
@@ -242,7 +407,7 @@ def _parse_expression(
         expr: Field value that may include comma-separated tokens.
         allowed: Sequence of acceptable integer values for the field.
         transform_map: Optional mapping of symbolic tokens to integers.
-        normalizer: Optional callable used to normalise parsed values.
+        normalizer: Optional callable used to normalise the bitmask of parsed values.
 
     Returns:
         tuple[int, ...]: Sorted set of integers represented by ``expr``.
@@ -252,17 +417,17 @@ def _parse_expression(
 
     """
     parts = expr.split(",")
-    result: set[int] = set()
+    mask = 0
     try:
         for part in parts:
-            values = _parse_part(part, allowed, transform_map)
-            if normalizer:
-                values = tuple(normalizer(value) for value in values)
-            result.update(values)
+            for value in _parse_part(part, allowed, transform_map):
+                mask |= 1 << value
     except ValueError as exc:
         raise ValueError(_invalid_cron_message(expr)) from exc
+    if normalizer:
+        mask = normalizer(mask)
 
-    return tuple(sorted(result))
+    return tuple(value for value in range(mask.bit_length()) if mask >> value & 1)
 
 
 def _parse_part(part: str, allowed: tuple[int, ...], transform_map: dict[str, int] | None = None) -> tuple[int, ...]:
@@ -280,60 +445,53 @@ def _parse_part(part: str, allowed: tuple[int, ...], transform_map: dict[str, in
         ValueError: If ``part`` contains invalid syntax or values.
 
     """
-    transform_map = _normalize_transform_map(transform_map)
-    value_expr, step_expr = _expr_to_parts(part)
-
-    if value_expr.upper() in transform_map:
-        value_expr = str(transform_map[value_expr.upper()])
-
-    if value_expr.isdigit():
-        if step_expr != 1:
+    match = _TOKEN_PATTERN.fullmatch(part)
+    if match is None:
+        raise ValueError(_invalid_cron_message(part))
+    start_expr, end_expr, step_expr = match.groups()
+    step = 1 if step_expr is None else int(step_expr)
+    if step <= 0:
+        raise ValueError(_invalid_cron_message(part))
+
+    if start_expr == "*":
+        if end_expr is not None:
             raise ValueError(_invalid_cron_message(part))
-        if int(value_expr) not in allowed:
-            raise ValueError(_invalid_cron_message(part))
-        return (int(value_expr),)
-
-    if value_expr == "*":
-        return tuple(range(allowed[0], allowed[-1] + 1, step_expr))
+        return tuple(range(allowed[0], allowed[-1] + 1, step))
 
-    if "-" in value_expr and (result := _parse_range(value_expr, allowed, step_expr, transform_map)):
-        return result
+    start = _resolve_token(start_expr, allowed, transform_map)
+    if end_expr is None:
+        if step != 1:
+            raise ValueError(_invalid_cron_message(part))
+        return (start,)
 
-    raise ValueError(_invalid_cron_message(part))
+    end = _resolve_token(end_expr, allowed, transform_map)
+    if start > end:
+        raise ValueError(_invalid_cron_message(part))
+    return tuple(range(start, end + 1, step))
 
 
-def _parse_range(
-    value_expr: str, allowed: tuple[int, ...], step_expr: int, transform_map: dict[str, int]
-) -> tuple[int, ...]:
-    """Interpret a ranged cron token such as ``1-5`` or ``MON-FRI``.
+def _resolve_token(token: str, allowed: tuple[int, ...], transform_map: dict[str, int] | None) -> int:
+    """Resolve a numeric or symbolic cron value to an integer.
 
     Args:
-        value_expr: Range expression containing a single dash.
+        token: Digits or a symbolic name such as ``MON`` or ``JAN``.
         allowed: Sequence of permissible integer values.
-        step_expr: Step increment applied to the expanded range.
-        transform_map: Mapping of symbolic values to integers.
+        transform_map: Mapping of upper-case symbolic values to integers.
 
     Returns:
-        tuple[int, ...]: Values covered by the inclusive range.
+        int: Value represented by ``token``.
 
     Raises:
-        ValueError: If the range bounds are invalid or out of order.
+        ValueError: If ``token`` is an unknown name or out of range.
 
     """
-    start, end = value_expr.split("-")
-    if start.upper() in transform_map:
-        start = str(transform_map[start.upper()])
-    if end.upper() in transform_map:
-        end = str(transform_map[end.upper()])
-    start_int, end_int = int(start), int(end)
-    if start_int not in allowed or end_int not in allowed:
-        raise ValueError(_invalid_cron_message(value_expr))
-    if start_int > end_int:
-        raise ValueError(_invalid_cron_message(value_expr))
-    result = tuple(range(start_int, end_int + 1, step_expr))
-    if not result:
-        raise ValueError(_invalid_cron_message(value_expr))
-    return result
+    if token.isdigit():
+        value: int | None = int(token)
+    else:
+        value = transform_map.get(token.upper()) if transform_map else None
+    if value is None or value not in allowed:
+        raise ValueError(_invalid_cron_message(token))
+    return value
 
 
 def _invalid_cron_message(expr: str) -> str:
@@ -349,47 +507,28 @@ def _invalid_cron_message(expr: str) -> str:
     return f"{expr!r} is not valid cron expression."
 
 
-def _expr_to_parts(expr: str) -> tuple[str, int]:
-    """Split a cron token into its base expression and step.
-
-    Args:
-        expr: Raw token that may contain a step separated by ``/``.
+def _to_mask(values: Iterable[int]) -> int:
+    """Pack field values into an integer bitmask.
 
     Returns:
-        tuple[str, int]: Base token value and validated step size.
-
-    Raises:
-        ValueError: If the step value is missing, non-numeric, or non-positive.
+        int: Bitmask with bit ``n`` set for every ``n`` in ``values``.
 
     """
-    if "/" in expr:
-        value_expr, step_expr = expr.split("/")
-        if not step_expr.isdigit():
-            raise ValueError(_invalid_cron_message(expr))
-        step_expr_int = int(step_expr)
-        if step_expr_int <= 0:
-            raise ValueError(_invalid_cron_message(expr))
-    else:
-        value_expr, step_expr_int = expr, 1
+    return sum(1 << value for value in set(values))
 
-    return value_expr, step_expr_int
 
-
-def _normalize_transform_map(transform_map: dict[str, int] | None) -> dict[str, int]:
-    if not transform_map:
-        return {}
-    return {key.upper(): value for key, value in transform_map.items()}
-
-
-def _normalize_day_of_week(value: int) -> int:
-    return 0 if value == SUNDAY_ALIAS_VALUE else value
-
-
-def _cron_weekday(when: datetime) -> int:
-    """Convert a :class:`datetime` weekday to cron numbering where Sunday is 0.
+def _next_bit(mask: int, start: int) -> int | None:
+    """Return the lowest set bit of ``mask`` at or above ``start``.
 
     Returns:
-        int: Cron-style weekday with Sunday represented by 0.
+        int | None: Bit index, or None when no bit at or above ``start`` is set.
 
     """
-    return (when.weekday() + 1) % CRON_WEEKDAY_COUNT
+    remaining = mask >> start
+    if not remaining:
+        return None
+    return start + (remaining & -remaining).bit_length() - 1
+
+
+def _normalize_day_of_week_mask(mask: int) -> int:
+    return mask & ~(1 << SUNDAY_ALIAS_VALUE) | 1 if mask >> SUNDAY_ALIAS_VALUE & 1 else mask
@@ -18,13 +18,19 @@ __all__ = [
     "ExpiresIn",
 ]
 import datetime
+import time
 from abc import ABC, abstractmethod
 from typing import final, override
 
+# Clock used for "now"-relative computations; tests swap it out to pin the current moment.
+_now = time.time
+
 
 class Expiration(ABC):
     """Interface for expressing expiration points or timeouts."""
 
+    __slots__ = ()
+
     @abstractmethod
     def as_timestamp(self) -> float:
         """Return the expiration moment as seconds since the Unix epoch.
@@ -68,17 +74,20 @@ class ExpiresIn(Expiration):
 
     """
 
+    __slots__ = ("_ttl", "_ttl_seconds")
+
     def __init__(self, ttl: datetime.timedelta) -> None:
         """Store TTL used for all subsequent expiration computations."""
         self._ttl = ttl
+        self._ttl_seconds = ttl.total_seconds()
 
     @override
     def as_timestamp(self) -> float:
-        return (datetime.datetime.now(datetime.UTC) + self._ttl).timestamp()
+        return _now() + self._ttl_seconds
 
     @override
     def as_datetime(self, tz: datetime.tzinfo = datetime.UTC) -> datetime.datetime:
-        return datetime.datetime.now(tz) + self._ttl
+        return datetime.datetime.fromtimestamp(_now() + self._ttl_seconds, tz)
 
     @override
     def as_ttl(self) -> datetime.timedelta:
@@ -98,6 +107,8 @@ class ExpiresAfter(Expiration):
 
     """
 
+    __slots__ = ("_expires_at", "_expires_ts", "_since", "_ttl")
+
     def __init__(self, ttl: datetime.timedelta, since: datetime.datetime) -> None:
         """Bind TTL to the provided ``since`` datetime.
 
@@ -110,20 +121,21 @@ class ExpiresAfter(Expiration):
             raise ValueError(timezone_error)
         self._since = since
         self._ttl = ttl
+        self._expires_at = since + ttl
+        self._expires_ts = self._expires_at.timestamp()
 
     @override
     def as_timestamp(self) -> float:
-        return (self._since + self._ttl).timestamp()
+        return self._expires_ts
 
     @override
     def as_datetime(self, tz: datetime.tzinfo = datetime.UTC) -> datetime.datetime:
-        return (self._since + self._ttl).astimezone(tz)
+        return self._expires_at.astimezone(tz)
 
     @override
     def as_ttl(self) -> datetime.timedelta:
-        now = datetime.datetime.now(datetime.UTC)
-        remaining = (self._since + self._ttl) - now
-        return max(datetime.timedelta(0), remaining)
+        remaining_seconds = max(0.0, self._expires_ts - _now())
+        return datetime.timedelta(seconds=remaining_seconds)
 
 
 @final
@@ -138,6 +150,8 @@ class ExpiresAtTS(Expiration):
 
     """
 
+    __slots__ = ("_timestamp",)
+
     def __init__(self, timestamp: float) -> None:
         """Capture absolute expiration timestamp.
 
@@ -160,8 +174,7 @@ class ExpiresAtTS(Expiration):
 
     @override
     def as_ttl(self) -> datetime.timedelta:
-        now = datetime.datetime.now(datetime.UTC).timestamp()
-        remaining_seconds = max(0.0, self._timestamp - now)
+        remaining_seconds = max(0.0, self._timestamp - _now())
         return datetime.timedelta(seconds=remaining_seconds)
 
 
@@ -177,6 +190,8 @@ class ExpiresAtDT(Expiration):
 
     """
 
+    __slots__ = ("_dt", "_timestamp")
+
     def __init__(self, expires_at: datetime.datetime) -> None:
         """Store absolute expiration datetime.
 
@@ -188,10 +203,11 @@ class ExpiresAtDT(Expiration):
         if expires_at.tzinfo is None:
             raise ValueError(timezone_error)
         self._dt = expires_at
+        self._timestamp = expires_at.timestamp()
 
     @override
     def as_timestamp(self) -> float:
-        return self._dt.timestamp()
+        return self._timestamp
 
     @override
     def as_datetime(self, tz: datetime.tzinfo = datetime.UTC) -> datetime.datetime:
@@ -199,6 +215,5 @@ class ExpiresAtDT(Expiration):
 
     @override
     def as_ttl(self) -> datetime.timedelta:
-        now = datetime.datetime.now(datetime.UTC)
-        remaining = self._dt - now
-        return max(datetime.timedelta(0), remaining)
+        remaining_seconds = max(0.0, self._timestamp - _now())
+        return datetime.timedelta(seconds=remaining_seconds)
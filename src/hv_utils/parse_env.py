@@ -21,6 +21,7 @@ from __future__ import annotations
 import os
 from collections.abc import Callable, Mapping
 from enum import Enum
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any, NoReturn
 
 from hv_utils.parse_str import (
@@ -109,11 +110,15 @@ def on_error_return_value[T](value: T | None) -> ErrorHandler:
         ErrorHandler[T]: Callable compatible with :func:`get_env`'s ``on_error`` parameter.
 
     """
+    return partial(_return_value, value)
 
-    def _on_error(_name: str, _value: str | None = None, _cast: CastFn | None = None) -> T | None:
-        return value
 
-    return _on_error
+def _return_value[T](value: T, _name: str, _raw: str | None = None, _cast: CastFn | None = None) -> T:
+    return value
+
+
+# Shared handler for the common "optional, no default" case so wrappers do not allocate one per call.
+_RETURN_NONE: ErrorHandler = on_error_return_value(None)
 
 
 def get_env[T](
@@ -142,20 +147,7 @@ def get_env[T](
         T | None: Parsed value, provided default, or result of ``on_error``.
 
     """
-    if env is None:
-        env = os.environ
-
-    try:
-        raw = env[name]
-    except KeyError:
-        if default is MISSING:
-            return on_error(name, None, cast)
-        return default
-
-    try:
-        return cast(raw)
-    except (TypeError, ValueError):
-        return on_error(name, raw, cast)
+    return _get_env_fast(name, cast, default, env, on_error)
 
 
 def env_or_none[T](name: str, *, cast: Callable[[str], T], env: Mapping[str, str] | None = None) -> T | None:
@@ -170,7 +162,7 @@ def env_or_none[T](name: str, *, cast: Callable[[str], T], env: Mapping[str, str
         T | None: Parsed value or ``None`` when absent or unparsable.
 
     """
-    return get_env(name, cast=cast, default=None, env=env, on_error=on_error_return_value(None))
+    return _get_env_fast(name, cast, None, env, _RETURN_NONE)
 
 
 def env_or_default[T](
@@ -188,7 +180,7 @@ def env_or_default[T](
         T | None: Parsed value or provided default when missing/invalid.
 
     """
-    return get_env(name, cast=cast, default=default, env=env, on_error=on_error_return_value(default))
+    return _get_env_fast(name, cast, default, env, on_error_return_value(default))
 
 
 def env_str(
@@ -267,11 +259,7 @@ def env_enum[TEnum: Enum](
         TEnum | None: Parsed enum member, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> TEnum:
-        return parse_enum(raw, enum_type)
-
-    return _env_wrapper(name, parser, default=default, required=required, env=env)
+    return _env_wrapper(name, _enum_parser(enum_type), default=default, required=required, env=env)
 
 
 def env_path(
@@ -324,11 +312,7 @@ def env_datetime(
         datetime | None: Parsed datetime, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> datetime:
-        return parse_datetime(raw, tzinfo=tzinfo)
-
-    return _env_wrapper(name, parser, default=default, required=required, env=env)
+    return _env_wrapper(name, _datetime_parser(tzinfo), default=default, required=required, env=env)
 
 
 def env_list[T](  # noqa: PLR0913
@@ -346,11 +330,7 @@ def env_list[T](  # noqa: PLR0913
         list[T] | None: Parsed list, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> list[T]:
-        return parse_list(raw, sep=sep, item_cast=item_cast)
-
-    return _env_wrapper(name, parser, default=default, required=required, env=env)
+    return _env_wrapper(name, _list_parser(sep, item_cast), default=default, required=required, env=env)
 
 
 def env_set[T](  # noqa: PLR0913
@@ -368,11 +348,7 @@ def env_set[T](  # noqa: PLR0913
         set[T] | None: Parsed set, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> set[T]:
-        return parse_set(raw, sep=sep, item_cast=item_cast)
-
-    return _env_wrapper(name, parser, default=default, required=required, env=env)
+    return _env_wrapper(name, _set_parser(sep, item_cast), default=default, required=required, env=env)
 
 
 def env_mapping(  # noqa: PLR0913
@@ -390,11 +366,7 @@ def env_mapping(  # noqa: PLR0913
         dict[str, str] | None: Parsed mapping, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> dict[str, str]:
-        return parse_mapping(raw, pair_sep=pair_sep, kv_sep=kv_sep)
-
-    return _env_wrapper(name, parser, default=default, required=required, env=env)
+    return _env_wrapper(name, _mapping_parser(pair_sep, kv_sep), default=default, required=required, env=env)
 
 
 def env_json(
@@ -416,6 +388,7 @@ def env_base64_bytes(
     default: bytes | None = None,
     required: bool = False,
     env: Mapping[str, str] | None = None,
+    validate: bool = True,
 ) -> bytes | None:
     """Return base64-decoded bytes from an environment variable.
 
@@ -423,7 +396,8 @@ def env_base64_bytes(
         bytes | None: Decoded bytes, provided default, or ``None`` when optional and missing.
 
     """
-    return _env_wrapper(name, parse_base64_bytes, default=default, required=required, env=env)
+    parser = parse_base64_bytes if validate else _base64_bytes_lenient
+    return _env_wrapper(name, parser, default=default, required=required, env=env)
 
 
 def env_base64_str(  # noqa: PLR0913
@@ -434,6 +408,7 @@ def env_base64_str(  # noqa: PLR0913
     env: Mapping[str, str] | None = None,
     encoding: str = "utf-8",
     errors: str = "strict",
+    validate: bool = True,
 ) -> str | None:
     """Return base64-decoded text from an environment variable.
 
@@ -441,10 +416,7 @@ def env_base64_str(  # noqa: PLR0913
         str | None: Decoded string, provided default, or ``None`` when optional and missing.
 
     """
-
-    def parser(raw: str) -> str:
-        return parse_base64_str(raw, encoding=encoding, errors=errors)
-
+    parser = _base64_str_parser(encoding, errors, validate)
     return _env_wrapper(name, parser, default=default, required=required, env=env)
 
 
@@ -465,6 +437,93 @@ def _env_wrapper[T](
         T | None: Parsed value, provided default, or ``None`` when optional and missing.
 
     """
-    handler: ErrorHandler = raise_error if required else on_error_return_value(default)
-    default_value: T | None = MISSING if required else default
-    return get_env(name, cast=parser, default=default_value, env=env, on_error=handler)
+    if required:
+        return _get_env_fast(name, parser, MISSING, env, raise_error)
+    if default is None:
+        return _get_env_fast(name, parser, None, env, _RETURN_NONE)
+    return _get_env_fast(name, parser, default, env, on_error_return_value(default))
+
+
+def _get_env_fast[T](
+    name: str,
+    cast: Callable[[str], T],
+    default: T | None,
+    env: Mapping[str, str] | None,
+    on_error: ErrorHandler,
+    /,
+) -> T | None:
+    """Positional-only body of :func:`get_env` used by the in-module wrappers.
+
+    Returns:
+        T | None: Parsed value, provided default, or result of ``on_error``.
+
+    """
+    if env is None:
+        env = os.environ
+
+    raw = env.get(name, MISSING)
+    if raw is MISSING:
+        if default is MISSING:
+            return on_error(name, None, cast)
+        return default
+
+    try:
+        return cast(raw)
+    except (TypeError, ValueError):
+        return on_error(name, raw, cast)
+
+
+def _base64_bytes_lenient(raw: str) -> bytes:
+    return parse_base64_bytes(raw, validate=False)
+
+
+# Parser factories keyed only by hashable configuration are memoized so repeated ``env_*`` calls reuse one callable.
+# List and set parsers are not: their ``item_cast`` may be unhashable, or a fresh lambda per call.
+# Neither is the datetime parser: distinct zones with equal offsets compare equal, and some tzinfo types are
+# unhashable.
+_PARSER_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _enum_parser[TEnum: Enum](enum_type: type[TEnum]) -> Callable[[str], TEnum]:
+    def parser(raw: str) -> TEnum:
+        return parse_enum(raw, enum_type)
+
+    return parser
+
+
+def _datetime_parser(tzinfo: tzinfo | None) -> Callable[[str], datetime]:
+    def parser(raw: str) -> datetime:
+        return parse_datetime(raw, tzinfo=tzinfo)
+
+    return parser
+
+
+def _list_parser[T](sep: str, item_cast: ItemCast[T] | None) -> Callable[[str], list[T]]:
+    def parser(raw: str) -> list[T]:
+        return parse_list(raw, sep=sep, item_cast=item_cast)
+
+    return parser
+
+
+def _set_parser[T](sep: str, item_cast: ItemCast[T] | None) -> Callable[[str], set[T]]:
+    def parser(raw: str) -> set[T]:
+        return parse_set(raw, sep=sep, item_cast=item_cast)
+
+    return parser
+
+
+@lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _mapping_parser(pair_sep: str, kv_sep: str) -> Callable[[str], dict[str, str]]:
+    def parser(raw: str) -> dict[str, str]:
+        return parse_mapping(raw, pair_sep=pair_sep, kv_sep=kv_sep)
+
+    return parser
+
+
+@lru_cache(maxsize=_PARSER_CACHE_SIZE)
+def _base64_str_parser(encoding: str, errors: str, validate: bool) -> Callable[[str], str]:  # noqa: FBT001
+    def parser(raw: str) -> str:
+        return parse_base64_str(raw, encoding=encoding, errors=errors, validate=validate)
+
+    return parser
@@ -18,16 +18,14 @@ env wrappers and other callers that need predictable error semantics.
 
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import re
 from collections.abc import Callable
 from datetime import datetime, timedelta, tzinfo
-from decimal import Decimal, InvalidOperation
 from enum import Enum
-from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar, cast
-from urllib.parse import ParseResult, urlparse
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Final, TypeVar, cast
 
 __all__ = [
     "ItemCast",
@@ -55,6 +53,10 @@ __all__ = [
 
 
 if TYPE_CHECKING:
+    from decimal import Decimal
+    from pathlib import Path
+    from urllib.parse import ParseResult
+
     from hv_utils.hv_types import JSONValue
 
 type ItemCast[T] = Callable[[str], T]
@@ -63,33 +65,58 @@ type MappingValue[T] = Callable[[str], T]
 
 E = TypeVar("E", bound=Enum)
 
-_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
-_FALSE_VALUES = {"0", "false", "no", "n", "off"}
-_BYTES_DECIMAL_MULTIPLIERS: dict[str, Decimal] = {
-    "": Decimal(1),
-    "B": Decimal(1),
-    "K": Decimal(1_000),
-    "KB": Decimal(1_000),
-    "M": Decimal(1_000_000),
-    "MB": Decimal(1_000_000),
-    "G": Decimal(1_000_000_000),
-    "GB": Decimal(1_000_000_000),
-    "T": Decimal(1_000_000_000_000),
-    "TB": Decimal(1_000_000_000_000),
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
+# Common spellings are pre-cased so well-formed input resolves with a single lookup.
+_BOOL_LITERALS: dict[str, bool] = {
+    variant: result
+    for tokens, result in ((_TRUE_VALUES, True), (_FALSE_VALUES, False))
+    for token in tokens
+    for variant in (token, token.upper(), token.capitalize())
 }
-_BYTES_BINARY_MULTIPLIERS: dict[str, Decimal] = {
-    "KI": Decimal(1024),
-    "KIB": Decimal(1024),
-    "MI": Decimal(1024**2),
-    "MIB": Decimal(1024**2),
-    "GI": Decimal(1024**3),
-    "GIB": Decimal(1024**3),
-    "TI": Decimal(1024**4),
-    "TIB": Decimal(1024**4),
+_BYTES_MULTIPLIERS: dict[str, int] = {
+    # Decimal (SI) units.
+    "": 1,
+    "B": 1,
+    "K": 1_000,
+    "KB": 1_000,
+    "M": 1_000_000,
+    "MB": 1_000_000,
+    "G": 1_000_000_000,
+    "GB": 1_000_000_000,
+    "T": 1_000_000_000_000,
+    "TB": 1_000_000_000_000,
+    # Binary (IEC) units.
+    "KI": 1024,
+    "KIB": 1024,
+    "MI": 1024**2,
+    "MIB": 1024**2,
+    "GI": 1024**3,
+    "GIB": 1024**3,
+    "TI": 1024**4,
+    "TIB": 1024**4,
 }
 
-_SIZE_PATTERN = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Za-z]{0,3})\s*$")
+_FROM_ISOFORMAT: Final = datetime.fromisoformat
+# Only short scalar fragments (flags, small literals) are memoized; containers are mutable and never cached.
+_JSON_CACHE_MAX_LENGTH: Final = 1024
+_JSON_CONTAINER_OPENERS: Final = frozenset({"{", "["})
+
+_SIZE_PATTERN = re.compile(r"^\s*([0-9]+)(\.[0-9]+)?\s*([A-Za-z]{0,3})\s*$")
 _DURATION_PATTERN = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([smhdSMHD])\s*$")
+_SIZE_MATCH: Final = _SIZE_PATTERN.fullmatch
+_DURATION_MATCH: Final = _DURATION_PATTERN.fullmatch
+# Both cases are listed so the unit captured by the pattern needs no normalization.
+_DURATION_SECONDS: dict[str, int] = {
+    "s": 1,
+    "S": 1,
+    "m": 60,
+    "M": 60,
+    "h": 3600,
+    "H": 3600,
+    "d": 86400,
+    "D": 86400,
+}
 
 
 def parse_str(value: str) -> str:
@@ -112,11 +139,11 @@ def parse_bool(value: str) -> bool:
         ValueError: If the value cannot be interpreted as a boolean.
 
     """
-    normalized = value.strip().lower()
-    if normalized in _TRUE_VALUES:
-        return True
-    if normalized in _FALSE_VALUES:
-        return False
+    result = _BOOL_LITERALS.get(value)
+    if result is None:
+        result = _BOOL_LITERALS.get(value.strip().lower())
+    if result is not None:
+        return result
     message = f"Invalid boolean literal: {value!r}"
     raise ValueError(message)
 
@@ -132,7 +159,7 @@ def parse_int(value: str) -> int:
 
     """
     try:
-        return int(value.strip())
+        return int(value)
     except ValueError as exc:
         msg = f"Invalid integer literal: {value!r}"
         raise ValueError(msg) from exc
@@ -149,7 +176,7 @@ def parse_float(value: str) -> float:
 
     """
     try:
-        return float(value.strip())
+        return float(value)
     except ValueError as exc:
         msg = f"Invalid float literal: {value!r}"
         raise ValueError(msg) from exc
@@ -165,8 +192,10 @@ def parse_decimal(value: str) -> Decimal:
         ValueError: If the value is not a valid decimal literal.
 
     """
+    from decimal import Decimal, InvalidOperation  # noqa: PLC0415 - deferred to keep module import light
+
     try:
-        return Decimal(value.strip())
+        return Decimal(value)
     except InvalidOperation as exc:
         msg = f"Invalid decimal literal: {value!r}"
         raise ValueError(msg) from exc
@@ -183,10 +212,10 @@ def parse_enum[E: Enum](value: str, enum_type: type[E]) -> E:
 
     """
     normalized = value.strip()
-    try:
-        return enum_type[normalized]
-    except KeyError:
-        pass
+    # ``@cache`` erases the generic signature of ``_enum_index``, so the member type is restored explicitly.
+    member = cast("E | None", _enum_index(enum_type).get(normalized))
+    if member is not None:
+        return member
     try:
         return enum_type(normalized)
     except (ValueError, TypeError) as exc:
@@ -201,6 +230,8 @@ def parse_path(value: str) -> Path:
         Path: Parsed path object.
 
     """
+    from pathlib import Path  # noqa: PLC0415 - deferred to keep module import light
+
     return Path(value)
 
 
@@ -214,11 +245,13 @@ def parse_url(value: str) -> ParseResult:
         ValueError: If the URL is missing a scheme.
 
     """
-    result = urlparse(value)
-    if not result.scheme:
+    from urllib.parse import urlparse, urlsplit  # noqa: PLC0415 - deferred to keep module import light
+
+    if not urlsplit(value).scheme:
         msg = f"Invalid URL (missing scheme): {value!r}"
         raise ValueError(msg)
-    return result
+    # ``urlsplit`` memoizes its results, so ``urlparse`` reuses the split computed above.
+    return urlparse(value)
 
 
 def parse_timedelta(value: str) -> timedelta:
@@ -231,19 +264,13 @@ def parse_timedelta(value: str) -> timedelta:
         ValueError: If the literal is not recognised.
 
     """
-    match = _DURATION_PATTERN.fullmatch(value)
+    match = _DURATION_MATCH(value)
     if not match:
         msg = f"Invalid duration literal: {value!r}"
         raise ValueError(msg)
     amount_str, unit = match.groups()
     amount = float(amount_str)
-    seconds_per_unit = {
-        "S": 1,
-        "M": 60,
-        "H": 3600,
-        "D": 86400,
-    }
-    multiplier = seconds_per_unit[unit.upper()]
+    multiplier = _DURATION_SECONDS[unit]
     return timedelta(seconds=amount * multiplier)
 
 
@@ -254,9 +281,9 @@ def parse_datetime(value: str, *, tzinfo: tzinfo | None = None) -> datetime:
         datetime: Parsed datetime with timezone adjusted if requested.
 
     """
-    dt = datetime.fromisoformat(value)
     if tzinfo is None:
-        return dt
+        return _FROM_ISOFORMAT(value)
+    dt = _FROM_ISOFORMAT(value)
     if dt.tzinfo is None:
         return dt.replace(tzinfo=tzinfo)
     return dt.astimezone(tzinfo)
@@ -272,19 +299,20 @@ def parse_bytes_size(value: str) -> int:
         ValueError: If the unit is unknown or resolves to fractional bytes.
 
     """
-    match = _SIZE_PATTERN.fullmatch(value)
+    match = _SIZE_MATCH(value)
     if not match:
         msg = f"Invalid byte size literal: {value!r}"
         raise ValueError(msg)
-    number, unit = match.groups()
-    unit_normalized = unit.upper()
-    multiplier = _BYTES_DECIMAL_MULTIPLIERS.get(unit_normalized)
-    if multiplier is None:
-        multiplier = _BYTES_BINARY_MULTIPLIERS.get(unit_normalized)
+    whole, fraction, unit = match.groups()
+    multiplier = _BYTES_MULTIPLIERS.get(unit.upper())
     if multiplier is None:
         msg = f"Unknown size unit in {value!r}"
         raise ValueError(msg)
-    quantity = Decimal(number) * multiplier
+    if fraction is None:
+        return int(whole) * multiplier
+    from decimal import Decimal  # noqa: PLC0415 - deferred to keep module import light
+
+    quantity = Decimal(whole + fraction) * multiplier
     if quantity != quantity.to_integral_value():
         msg = f"Size must resolve to whole bytes: {value!r}"
         raise ValueError(msg)
@@ -301,8 +329,10 @@ def parse_list[T](value: str, *, sep: str = ",", item_cast: ItemCast[T] | None =
         ValueError: If any item is empty.
 
     """  # noqa: DOC502 - item case may raise ValueError
-    caster = item_cast or parse_str
-    return [caster(part) for part in _split_items(value, sep)]  # type: ignore[misc]
+    parts = _split_items(value, sep)
+    if item_cast is None:
+        return parts  # type: ignore[return-value]
+    return [item_cast(part) for part in parts]
 
 
 def parse_set[T](value: str, *, sep: str = ",", item_cast: ItemCast[T] | None = None) -> set[T]:
@@ -315,8 +345,10 @@ def parse_set[T](value: str, *, sep: str = ",", item_cast: ItemCast[T] | None =
         ValueError: If any item is empty.
 
     """  # noqa: DOC502 - ValueError may be raised by ItemCase
-    caster = item_cast or parse_str
-    return {caster(part) for part in _split_items(value, sep)}  # type: ignore[misc]
+    parts = _split_items(value, sep)
+    if item_cast is None:
+        return set(parts)  # type: ignore[arg-type]
+    return {item_cast(part) for part in parts}
 
 
 def parse_mapping(
@@ -353,10 +385,15 @@ def parse_mapping(
 def parse_json(value: str) -> JSONValue:
     """Parse a JSON string using :func:`json.loads`.
 
+    Short scalar inputs are memoized. Objects and arrays bypass the cache and are parsed afresh on every call, so
+    callers may mutate the result without affecting later calls.
+
     Returns:
         Any: Parsed JSON value.
 
     """
+    if len(value) <= _JSON_CACHE_MAX_LENGTH and value.lstrip()[:1] not in _JSON_CONTAINER_OPENERS:
+        return _loads_cached(value)
     return cast("JSONValue", json.loads(value))
 
 
@@ -367,12 +404,18 @@ def parse_json_typed[T](value: str, *, loader: JsonLoader[T] = json.loads) -> T:
         T: Parsed JSON value.
 
     """
+    if loader is json.loads:
+        return cast("T", parse_json(value))
     return loader(value)
 
 
-def parse_base64_bytes(value: str) -> bytes:
+def parse_base64_bytes(value: str, *, validate: bool = True) -> bytes:
     """Decode a base64-encoded string into bytes.
 
+    Args:
+        value: Base64 text to decode.
+        validate: Reject characters outside the base64 alphabet; when ``False`` they are skipped.
+
     Returns:
         bytes: Decoded payload.
 
@@ -381,26 +424,39 @@ def parse_base64_bytes(value: str) -> bytes:
 
     """
     try:
-        return base64.b64decode(value, validate=True)
-    except (base64.binascii.Error, ValueError) as exc:  # type: ignore[attr-defined]
+        return binascii.a2b_base64(value, strict_mode=validate)
+    except (binascii.Error, ValueError) as exc:
         msg = f"Invalid base64 literal: {value!r}"
         raise ValueError(msg) from exc
 
 
-def parse_base64_str(value: str, *, encoding: str = "utf-8", errors: str = "strict") -> str:
+def parse_base64_str(value: str, *, encoding: str = "utf-8", errors: str = "strict", validate: bool = True) -> str:
     """Decode a base64-encoded string into text.
 
     Returns:
         str: Decoded text.
 
     """
-    raw = parse_base64_bytes(value)
+    raw = parse_base64_bytes(value, validate=validate)
     return raw.decode(encoding, errors)
 
 
+@lru_cache(maxsize=256)
+def _loads_cached(value: str) -> JSONValue:
+    return cast("JSONValue", json.loads(value))
+
+
+@cache
+def _enum_index[E: Enum](enum_type: type[E]) -> dict[str, E]:
+    # Names take precedence over values, matching ``enum_type[name]`` being tried first.
+    index = {member.value: member for member in enum_type if isinstance(member.value, str)}
+    index.update(enum_type.__members__)
+    return index
+
+
 def _split_items(value: str, sep: str) -> list[str]:
     parts = [part.strip() for part in value.split(sep)]
-    if any(part in {None, ""} for part in parts):
+    if not all(parts):
         msg = f"Empty item in separated list: {value!r}"
         raise ValueError(msg)
     return parts
@@ -30,16 +30,6 @@ class MissingType:
 
     __slots__ = ()
     _instance: Self | None = None
-    _ALLOWED_ATTRIBUTES: Final[frozenset[str]] = frozenset({
-        "__bool__",
-        "__class__",
-        "__copy__",
-        "__deepcopy__",
-        "__repr__",
-        "__reduce__",
-        "__reduce_ex__",
-        "__str__",
-    })
 
     def __new__(cls) -> Self:
         """Ensure the sentinel remains a singleton."""
@@ -47,18 +37,16 @@ class MissingType:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
-        """Restrict attribute access to a minimal allowlist.
+    def __getattr__(self, name: str) -> NoReturn:
+        """Raise for attributes the sentinel does not define.
 
-        Returns:
-            Any: The requested magic method or attribute when permitted.
+        Only consulted after normal lookup misses, so the protocol methods below resolve
+        without extra Python-level checks.
 
         Raises:
-            AttributeError: When accessing any attribute not explicitly allowed.
+            AttributeError: Always, naming the missing attribute.
 
         """
-        if name in MissingType._ALLOWED_ATTRIBUTES:
-            return super().__getattribute__(name)
         message = f"Missing sentinel has no attribute '{name}'"
         raise AttributeError(message)
 
@@ -12,89 +12,178 @@
 
 from pathlib import Path
 
-from tools.copyright_header import HeaderConfig, apply_header, build_header
+import pytest
+from tools.copyright_header import HEADER_SCAN_LIMIT, HeaderConfig, apply_header, build_header, main
 
+_HEADER_CONTRIBUTOR = build_header(
+    HeaderConfig(author="Contributor", year=2025, project="hv-utils", contributions=("Contributor — added demo",)),
+)
+_HEADER_ANOTHER = build_header(
+    HeaderConfig(author="Another", year=2025, project="hv-utils", contributions=("Another — demo",)),
+)
+_HEADER_SOMEONE = build_header(
+    HeaderConfig(author="Someone", year=2025, project="hv-utils", contributions=("Someone — example contribution",)),
+)
 
-def test_apply_header_inserts_template(tmp_path: Path) -> None:
+_EXISTING_HEADER_TEMPLATE = (
+    "# -----------------------------------------------------------------------------\n"
+    "#  Copyright (c) {year}  Someone\n"
+    "#\n"
+    "#  This file is part of hv-utils.\n"
+    "#  It is licensed under the BSD 3-Clause License.\n"
+    "#  See the LICENSE file in the project root for full license text.\n"
+    "#\n"
+    "#  Contributions:\n"
+    "#     - Someone — example contribution\n"
+    "# -----------------------------------------------------------------------------\n"
+)
+_EXISTING_HEADER_2024 = _EXISTING_HEADER_TEMPLATE.format(year=2024)
+_EXISTING_HEADER_2025 = _EXISTING_HEADER_TEMPLATE.format(year=2025)
+
+
+@pytest.fixture(scope="module")
+def header_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Share one temporary directory across the header tests in this module.
+
+    Returns:
+        Path: Directory that holds the per-test module files.
+
+    """
+    return tmp_path_factory.mktemp("headers")
+
+
+@pytest.fixture
+def file_path(header_dir: Path, request: pytest.FixtureRequest) -> Path:
+    """Name a module file unique to the requesting test inside the shared directory.
+
+    Returns:
+        Path: Not-yet-created ``.py`` path for the current test.
+
+    """
+    return header_dir / f"{request.node.name}.py"
+
+
+def test_apply_header_inserts_template(file_path: Path) -> None:
     """Header is inserted when missing."""
-    file_path = tmp_path / "module.py"
     file_path.write_text("def demo() -> None:\n    pass\n", encoding="utf-8")
 
-    header = build_header(
-        HeaderConfig(
-            author="Contributor",
-            year=2025,
-            project="hv-utils",
-            contributions=["Contributor — added demo"],
-        ),
-    )
-    updated = apply_header([file_path], header)
+    updated = apply_header([file_path], _HEADER_CONTRIBUTOR)
 
     content = file_path.read_text(encoding="utf-8")
     assert updated == [file_path]
-    assert content.startswith(header)
+    assert content.startswith(_HEADER_CONTRIBUTOR)
     assert "def demo()" in content
 
 
-def test_apply_header_skips_files_with_existing_header(tmp_path: Path) -> None:
+def test_apply_header_skips_files_with_existing_header(file_path: Path) -> None:
     """Existing header prevents duplicate insertion."""
-    existing_header = (
-        "# -----------------------------------------------------------------------------\n"
-        "#  Copyright (c) 2025  Someone\n"
-        "#\n"
-        "#  This file is part of hv-utils.\n"
-        "#  It is licensed under the BSD 3-Clause License.\n"
-        "#  See the LICENSE file in the project root for full license text.\n"
-        "#\n"
-        "#  Contributions:\n"
-        "#     - Someone — example contribution\n"
-        "# -----------------------------------------------------------------------------\n"
-    )
-    file_path = tmp_path / "module.py"
-    file_path.write_text(f"{existing_header}\nVALUE = 1\n", encoding="utf-8")
-    header = build_header(
-        HeaderConfig(
-            author="Another",
-            year=2025,
-            project="hv-utils",
-            contributions=["Another — demo"],
-        ),
-    )
+    file_path.write_text(f"{_EXISTING_HEADER_2025}\nVALUE = 1\n", encoding="utf-8")
 
-    updated = apply_header([file_path], header)
+    updated = apply_header([file_path], _HEADER_ANOTHER)
 
     content = file_path.read_text(encoding="utf-8")
     assert updated == []
-    assert content.startswith(existing_header)
+    assert content.startswith(_EXISTING_HEADER_2025)
 
 
-def test_apply_header_updates_existing_header_year(tmp_path: Path) -> None:
+def test_apply_header_updates_existing_header_year(file_path: Path) -> None:
     """Existing header is replaced when the requested header differs."""
-    existing_header = (
-        "# -----------------------------------------------------------------------------\n"
-        "#  Copyright (c) 2024  Someone\n"
-        "#\n"
-        "#  This file is part of hv-utils.\n"
-        "#  It is licensed under the BSD 3-Clause License.\n"
-        "#  See the LICENSE file in the project root for full license text.\n"
-        "#\n"
-        "#  Contributions:\n"
-        "#     - Someone — example contribution\n"
-        "# -----------------------------------------------------------------------------\n"
+    file_path.write_text(f"{_EXISTING_HEADER_2024}\nVALUE = 2\n", encoding="utf-8")
+
+    updated = apply_header([file_path], _HEADER_SOMEONE)
+
+    content = file_path.read_text(encoding="utf-8")
+    assert updated == [file_path]
+    assert content.startswith(_HEADER_SOMEONE)
+
+
+def test_apply_header_keeps_leading_metadata_and_body(file_path: Path) -> None:
+    """Shebang and coding lines stay ahead of the replaced header and the body is untouched."""
+    metadata = "#!/usr/bin/env python\n# -*- coding: utf-8 -*-\n"
+    file_path.write_text(f"{metadata}{_EXISTING_HEADER_2024}\nVALUE = 3", encoding="utf-8")
+
+    updated = apply_header([file_path], _HEADER_SOMEONE)
+
+    assert updated == [file_path]
+    assert file_path.read_text(encoding="utf-8") == f"{metadata}{_HEADER_SOMEONE}\nVALUE = 3"
+
+
+def test_main_only_rewrites_files_without_current_header(header_dir: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Files already starting with the requested header are skipped without being rewritten."""
+    current = header_dir / "current_header.py"
+    stale = header_dir / "stale_header.py"
+    current.write_text(f"{_HEADER_SOMEONE}\nVALUE = 4\n", encoding="utf-8")
+    stale.write_text(f"{_EXISTING_HEADER_2024}\nVALUE = 5\n", encoding="utf-8")
+    argv = ["--author", "Someone", "--year", "2025", "--project", "hv-utils"]
+    argv += ["--contribution", "Someone — example contribution", "--paths", str(current), str(stale)]
+
+    with caplog.at_level("INFO", logger="tools.copyright_header"):
+        assert main(argv) == 0
+
+    assert caplog.messages == [f"Added header: {stale}"]
+    assert current.read_text(encoding="utf-8") == f"{_HEADER_SOMEONE}\nVALUE = 4\n"
+    assert stale.read_text(encoding="utf-8") == f"{_HEADER_SOMEONE}\nVALUE = 5\n"
+
+
+def test_build_header_reuses_text_for_equal_configs() -> None:
+    """Equal configurations hit the memoized header instead of formatting it again."""
+    config = HeaderConfig(
+        author="Someone", year=2025, project="hv-utils", contributions=("Someone — example contribution",)
     )
-    file_path = tmp_path / "module.py"
-    file_path.write_text(f"{existing_header}\nVALUE = 2\n", encoding="utf-8")
-    header = build_header(
-        HeaderConfig(
-            author="Someone",
-            year=2025,
-            project="hv-utils",
-            contributions=["Someone — example contribution"],
-        ),
+
+    assert build_header(config) is _HEADER_SOMEONE
+
+
+def test_main_check_skips_excluded_directories(header_dir: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Excluded directories are pruned from the scan, so their modules are never reported."""
+    tree = header_dir / "check_tree"
+    (tree / ".venv").mkdir(parents=True)
+    (tree / "pkg").mkdir()
+    (tree / ".venv" / "vendored.py").write_text("VALUE = 6\n", encoding="utf-8")
+    (tree / "pkg" / "module.py").write_text("VALUE = 7\n", encoding="utf-8")
+
+    with caplog.at_level("INFO", logger="tools.copyright_header"):
+        assert main(["--check", "--paths", str(tree)]) == 1
+
+    assert caplog.messages == [str(tree / "pkg" / "module.py")]
+
+
+def test_apply_header_keeps_crlf_files_uniform(file_path: Path) -> None:
+    """CRLF files get a CRLF header, so the rewritten file never mixes line endings."""
+    body = "NAME = 'Ärger'\r\nVALUE = 8\r\n".encode()
+    file_path.write_bytes(_EXISTING_HEADER_2024.replace("\n", "\r\n").encode() + b"\r\n" + body)
+
+    updated = apply_header([file_path], _HEADER_SOMEONE)
+
+    content = file_path.read_bytes()
+    assert updated == [file_path]
+    assert content == _HEADER_SOMEONE.replace("\n", "\r\n").encode() + b"\r\n" + body
+    assert b"\n" not in content.replace(b"\r\n", b"")
+
+
+def test_apply_header_uses_preloaded_contents(file_path: Path) -> None:
+    """Preloaded contents are used as the file text instead of reading the path again."""
+    file_path.write_text("STALE = True\n", encoding="utf-8")
+
+    updated = apply_header([file_path], _HEADER_CONTRIBUTOR, preloaded={file_path: b"VALUE = 9\n"})
+
+    assert updated == [file_path]
+    assert file_path.read_text(encoding="utf-8") == f"{_HEADER_CONTRIBUTOR}\nVALUE = 9\n"
+
+
+def test_apply_header_replaces_headers_longer_than_scan_limit(file_path: Path) -> None:
+    """Headers too long for the prefix read are still found and replaced rather than duplicated."""
+    contributions = tuple(f"Someone — contribution {index}" for index in range(120))
+    old_header = build_header(
+        HeaderConfig(author="Someone", year=2024, project="hv-utils", contributions=contributions)
     )
+    new_header = build_header(
+        HeaderConfig(author="Someone", year=2025, project="hv-utils", contributions=contributions)
+    )
+    assert len(old_header.encode()) > HEADER_SCAN_LIMIT
+    file_path.write_text(f"{old_header}\nVALUE = 10\n", encoding="utf-8")
 
-    updated = apply_header([file_path], header)
+    updated = apply_header([file_path], new_header)
 
-    content = file_path.read_text(encoding="utf-8")
     assert updated == [file_path]
-    assert content.startswith(header)
+    assert file_path.read_text(encoding="utf-8") == f"{new_header}\nVALUE = 10\n"
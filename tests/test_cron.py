@@ -12,181 +12,189 @@
 
 from __future__ import annotations
 
+import copy
+import pickle  # noqa: S403 - round-tripping our own schedules
 import re
-from datetime import UTC, datetime
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime, timedelta
 from itertools import islice
 
 import pytest
 
 from hv_utils.cron import CronSchedule, cron_matches, parse_cron
 
-
-@pytest.mark.parametrize(
-    ("expression", "expected"),
-    [
-        pytest.param(
-            "0 0 1 1 0",
-            CronSchedule((0,), (0,), (1,), (1,), (0,)),
-            id="literals",
-        ),
-        pytest.param(
-            "* * * * *",
-            CronSchedule(
-                tuple(range(60)),
-                tuple(range(24)),
-                tuple(range(1, 32)),
-                tuple(range(1, 13)),
-                tuple(range(7)),
-            ),
-            id="wildcards",
-        ),
-        pytest.param(
-            "*/15 0-12/6 1,15 1-3 1-5/2",
-            CronSchedule(
-                tuple(range(0, 60, 15)),
-                (0, 6, 12),
-                (1, 15),
-                (1, 2, 3),
-                (1, 3, 5),
-            ),
-            id="steps-and-ranges",
+_VALID_CASES: dict[str, tuple[str, CronSchedule]] = {
+    "literals": (
+        "0 0 1 1 0",
+        CronSchedule((0,), (0,), (1,), (1,), (0,)),
+    ),
+    "wildcards": (
+        "* * * * *",
+        CronSchedule(
+            tuple(range(60)),
+            tuple(range(24)),
+            tuple(range(1, 32)),
+            tuple(range(1, 13)),
+            tuple(range(7)),
         ),
-        pytest.param(
-            "5,10-20/5 8,20 10-12 4,6-8 0,2-4",
-            CronSchedule(
-                (5, 10, 15, 20),
-                (8, 20),
-                (10, 11, 12),
-                (4, 6, 7, 8),
-                (0, 2, 3, 4),
-            ),
-            id="mixed-list-and-ranges",
+    ),
+    "steps-and-ranges": (
+        "*/15 0-12/6 1,15 1-3 1-5/2",
+        CronSchedule(
+            tuple(range(0, 60, 15)),
+            (0, 6, 12),
+            (1, 15),
+            (1, 2, 3),
+            (1, 3, 5),
         ),
-        pytest.param(
-            "30 14 * * 1-5",
-            CronSchedule(
-                (30,),
-                (14,),
-                tuple(range(1, 32)),
-                tuple(range(1, 13)),
-                (1, 2, 3, 4, 5),
-            ),
-            id="weekday-range",
+    ),
+    "mixed-list-and-ranges": (
+        "5,10-20/5 8,20 10-12 4,6-8 0,2-4",
+        CronSchedule(
+            (5, 10, 15, 20),
+            (8, 20),
+            (10, 11, 12),
+            (4, 6, 7, 8),
+            (0, 2, 3, 4),
         ),
-        pytest.param(
-            "0 */8 */2 */3 *",
-            CronSchedule(
-                (0,),
-                (0, 8, 16),
-                tuple(range(1, 32, 2)),
-                (1, 4, 7, 10),
-                tuple(range(7)),
-            ),
-            id="stepped-month-and-day",
+    ),
+    "weekday-range": (
+        "30 14 * * 1-5",
+        CronSchedule(
+            (30,),
+            (14,),
+            tuple(range(1, 32)),
+            tuple(range(1, 13)),
+            (1, 2, 3, 4, 5),
         ),
-        pytest.param(
-            "15,45 6-18/6 5,10-20/5 2,4,6 0,6",
-            CronSchedule(
-                (15, 45),
-                (6, 12, 18),
-                (5, 10, 15, 20),
-                (2, 4, 6),
-                (0, 6),
-            ),
-            id="edge-dow-values",
+    ),
+    "stepped-month-and-day": (
+        "0 */8 */2 */3 *",
+        CronSchedule(
+            (0,),
+            (0, 8, 16),
+            tuple(range(1, 32, 2)),
+            (1, 4, 7, 10),
+            tuple(range(7)),
         ),
-        pytest.param(
-            "0 6 10 JAN,FEB,MAR 1",
-            CronSchedule(
-                (0,),
-                (6,),
-                (10,),
-                (1, 2, 3),
-                (1,),
-            ),
-            id="month-name-list",
+    ),
+    "edge-dow-values": (
+        "15,45 6-18/6 5,10-20/5 2,4,6 0,6",
+        CronSchedule(
+            (15, 45),
+            (6, 12, 18),
+            (5, 10, 15, 20),
+            (2, 4, 6),
+            (0, 6),
         ),
-        pytest.param(
-            "0 9 15 APR-JUN/2 0",
-            CronSchedule(
-                (0,),
-                (9,),
-                (15,),
-                (4, 6),
-                (0,),
-            ),
-            id="month-name-range-step",
+    ),
+    "month-name-list": (
+        "0 6 10 JAN,FEB,MAR 1",
+        CronSchedule(
+            (0,),
+            (6,),
+            (10,),
+            (1, 2, 3),
+            (1,),
         ),
-        pytest.param(
-            "45 18 1 JAN-DEC/3 0-6/2",
-            CronSchedule(
-                (45,),
-                (18,),
-                (1,),
-                (1, 4, 7, 10),
-                (0, 2, 4, 6),
-            ),
-            id="month-name-yearly-step",
+    ),
+    "month-name-range-step": (
+        "0 9 15 APR-JUN/2 0",
+        CronSchedule(
+            (0,),
+            (9,),
+            (15,),
+            (4, 6),
+            (0,),
         ),
-        pytest.param(
-            "0 0 * * 0,7",
-            CronSchedule(
-                (0,),
-                (0,),
-                tuple(range(1, 32)),
-                tuple(range(1, 13)),
-                (0,),
-            ),
-            id="dow-seven-as-sunday",
+    ),
+    "month-name-yearly-step": (
+        "45 18 1 JAN-DEC/3 0-6/2",
+        CronSchedule(
+            (45,),
+            (18,),
+            (1,),
+            (1, 4, 7, 10),
+            (0, 2, 4, 6),
         ),
-        pytest.param(
-            "0 0 1 jan mon",
-            CronSchedule((0,), (0,), (1,), (1,), (1,)),
-            id="case-insensitive-names",
+    ),
+    "dow-seven-as-sunday": (
+        "0 0 * * 0,7",
+        CronSchedule(
+            (0,),
+            (0,),
+            tuple(range(1, 32)),
+            tuple(range(1, 13)),
+            (0,),
         ),
-        pytest.param(
-            "*/65 * * * *",
-            CronSchedule(
-                (0,),
-                tuple(range(24)),
-                tuple(range(1, 32)),
-                tuple(range(1, 13)),
-                tuple(range(7)),
-            ),
-            id="large-step-value",
+    ),
+    "case-insensitive-names": (
+        "0 0 1 jan mon",
+        CronSchedule((0,), (0,), (1,), (1,), (1,)),
+    ),
+    "large-step-value": (
+        "*/65 * * * *",
+        CronSchedule(
+            (0,),
+            tuple(range(24)),
+            tuple(range(1, 32)),
+            tuple(range(1, 13)),
+            tuple(range(7)),
         ),
-    ],
-)
-def test_cron_parser_valid(
-    expression: str,
-    expected: CronSchedule,
-) -> None:
-    """Validate cron parsing across multiple expression complexities."""
-    parsed = parse_cron(expression)
+    ),
+}
+
 
-    assert parsed == expected
+def test_cron_parser_valid() -> None:
+    """Validate cron parsing across multiple expression complexities in one batch."""
+    for case_id, (expression, expected) in _VALID_CASES.items():
+        assert parse_cron(expression) == expected, case_id
 
 
 @pytest.mark.parametrize(
-    "expression",
-    [
-        pytest.param("0 0", id="too-few-fields"),
-        pytest.param("0 0 1 1 0 extra", id="too-many-fields"),
-        pytest.param("0 24 * * *", id="hour-out-of-range"),
-        pytest.param("0 -1 * * *", id="negative-hour"),
-        pytest.param("0 0 32 * *", id="day-out-of-range"),
-        pytest.param("0 0 1 13 *", id="month-out-of-range"),
-        pytest.param("0 0 1 JANUARY *", id="invalid-month-name"),
-        pytest.param("0 0 1 * MONDAY", id="invalid-dow-name"),
-        pytest.param("*/0 * * * *", id="zero-step"),
-        pytest.param("*/-5 * * * *", id="negative-step"),
-        pytest.param("0 0 10-5 * *", id="descending-range"),
-    ],
+    "case_id",
+    ["literals", "steps-and-ranges", "month-name-range-step", "dow-seven-as-sunday", "large-step-value"],
 )
-def test_cron_parser_invalid(expression: str) -> None:
+def test_cron_parser_valid_diagnostic(case_id: str) -> None:
+    """Representative valid cases, reported one by one, whose bitmasks mirror the parsed field tuples."""
+    expression, expected = _VALID_CASES[case_id]
+    schedule = parse_cron(expression)
+
+    assert schedule == expected
+    for mask, values in (
+        (schedule.minute_mask, expected.minute),
+        (schedule.hour_mask, expected.hour),
+        (schedule.dom_mask, expected.day_of_month),
+        (schedule.month_mask, expected.month),
+        (schedule.dow_mask, expected.day_of_week),
+    ):
+        assert mask == sum(1 << value for value in values)
+
+
+_INVALID_EXPRESSIONS: dict[str, str] = {
+    "too-few-fields": "0 0",
+    "too-many-fields": "0 0 1 1 0 extra",
+    "hour-out-of-range": "0 24 * * *",
+    "negative-hour": "0 -1 * * *",
+    "day-out-of-range": "0 0 32 * *",
+    "month-out-of-range": "0 0 1 13 *",
+    "invalid-month-name": "0 0 1 JANUARY *",
+    "invalid-dow-name": "0 0 1 * MONDAY",
+    "zero-step": "*/0 * * * *",
+    "negative-step": "*/-5 * * * *",
+    "descending-range": "0 0 10-5 * *",
+}
+_INVALID_PATTERNS: dict[str, re.Pattern[str]] = {
+    expression: re.compile(re.escape(f"{expression!r} is not valid cron expression."))
+    for expression in _INVALID_EXPRESSIONS.values()
+}
+
+
+def test_cron_parser_invalid() -> None:
     """Ensure malformed cron expressions are rejected."""
-    with pytest.raises(ValueError, match=re.escape(f"{expression!r} is not valid cron expression.")):
-        parse_cron(expression)
+    for expression in _INVALID_EXPRESSIONS.values():
+        with pytest.raises(ValueError, match=_INVALID_PATTERNS[expression]):
+            parse_cron(expression)
 
 
 @pytest.mark.parametrize(
@@ -251,20 +259,22 @@ def test_cron_schedule_from_exp_factory() -> None:
     assert constructed == parsed
 
 
-@pytest.mark.parametrize(
-    ("expression", "start", "inclusive", "expected"),
-    [
-        ("*/5 * * * *", datetime(2025, 1, 1, 0, 2, tzinfo=UTC), False, datetime(2025, 1, 1, 0, 5, tzinfo=UTC)),
-        ("*/5 * * * *", datetime(2025, 1, 1, 0, 10, tzinfo=UTC), True, datetime(2025, 1, 1, 0, 10, tzinfo=UTC)),
-        ("0 12 15 * 1", datetime(2025, 1, 13, 11, 0, tzinfo=UTC), False, datetime(2025, 1, 13, 12, 0, tzinfo=UTC)),
-        ("0 12 15 * 1", datetime(2025, 1, 14, 11, 0, tzinfo=UTC), False, datetime(2025, 1, 15, 12, 0, tzinfo=UTC)),
-    ],
+_NEXT_CASES: tuple[tuple[str, datetime, bool, datetime], ...] = (
+    ("*/5 * * * *", datetime(2025, 1, 1, 0, 2, tzinfo=UTC), False, datetime(2025, 1, 1, 0, 5, tzinfo=UTC)),
+    ("*/5 * * * *", datetime(2025, 1, 1, 0, 10, tzinfo=UTC), True, datetime(2025, 1, 1, 0, 10, tzinfo=UTC)),
+    ("0 12 15 * 1", datetime(2025, 1, 13, 11, 0, tzinfo=UTC), False, datetime(2025, 1, 13, 12, 0, tzinfo=UTC)),
+    ("0 12 15 * 1", datetime(2025, 1, 14, 11, 0, tzinfo=UTC), False, datetime(2025, 1, 15, 12, 0, tzinfo=UTC)),
+    ("0 0 1 1 *", datetime(2025, 3, 5, 7, 30, tzinfo=UTC), False, datetime(2026, 1, 1, 0, 0, tzinfo=UTC)),
+    ("30 23 31 * *", datetime(2025, 4, 1, 0, 0, tzinfo=UTC), False, datetime(2025, 5, 31, 23, 30, tzinfo=UTC)),
+    ("0 9 * * FRI", datetime(2025, 1, 31, 9, 0, tzinfo=UTC), False, datetime(2025, 2, 7, 9, 0, tzinfo=UTC)),
 )
-def test_cron_schedule_next(expression: str, start: datetime, *, inclusive: bool, expected: datetime) -> None:
-    """Next occurrence is computed correctly with dom/dow OR semantics."""
-    schedule = CronSchedule.from_exp(expression)
 
-    assert schedule.next(start, inclusive=inclusive) == expected
+
+def test_cron_schedule_next() -> None:
+    """Next occurrence is computed correctly with dom/dow OR semantics."""
+    for expression, start, inclusive, expected in _NEXT_CASES:
+        schedule = CronSchedule.from_exp(expression)
+        assert schedule.next(start, inclusive=inclusive) == expected, (expression, start)
 
 
 def test_cron_schedule_iterates_future_beats() -> None:
@@ -296,3 +306,92 @@ def test_cron_matches_treats_wildcard_dow_as_unrestricted() -> None:
     when = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
 
     assert cron_matches(schedule, when)
+
+
+def test_cron_schedule_exposes_field_bitmasks() -> None:
+    """Each field is mirrored by a bitmask with one bit per allowed value."""
+    schedule = CronSchedule.from_exp("*/15 0,23 1 DEC SUN,7")
+
+    assert schedule.minute_mask == (1 << 0) | (1 << 15) | (1 << 30) | (1 << 45)
+    assert schedule.hour_mask == (1 << 0) | (1 << 23)
+    assert schedule.dom_mask == 1 << 1
+    assert schedule.month_mask == 1 << 12
+    assert schedule.dow_mask == 1 << 0
+
+
+def test_cron_schedule_iter_yields_consecutive_minutes() -> None:
+    """Iteration resumes right after the previous match without skipping a minute."""
+    schedule = CronSchedule.from_exp("* * * * *")
+    start = datetime(2025, 12, 31, 23, 58, tzinfo=UTC)
+
+    beats = list(islice(schedule.iter(start, inclusive=True), 3))
+
+    assert beats == [
+        datetime(2025, 12, 31, 23, 58, tzinfo=UTC),
+        datetime(2025, 12, 31, 23, 59, tzinfo=UTC),
+        datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+    ]
+
+
+def test_cron_schedule_is_immutable_and_hashable() -> None:
+    """Schedules are frozen value objects, so they can be cached and shared."""
+    schedule = CronSchedule.from_exp("0 0 * * *")
+
+    with pytest.raises(FrozenInstanceError):
+        schedule.minute = (1,)  # ty: ignore[invalid-assignment]
+    assert hash(schedule) == hash(CronSchedule.from_exp("0 0 * * *"))
+    assert not hasattr(schedule, "__dict__")
+
+
+def test_parse_cron_reuses_schedules_for_repeated_expressions() -> None:
+    """Parsing the same expression twice returns the memoized schedule instance."""
+    assert parse_cron("*/15 9-17 * * MON-FRI") is CronSchedule.from_exp("*/15 9-17 * * MON-FRI")
+
+
+def test_cron_schedule_next_skips_excluded_months_and_years() -> None:
+    """Months outside the schedule are skipped wholesale, even across years."""
+    schedule = CronSchedule.from_exp("0 0 29 FEB *")
+    start = datetime(2025, 3, 1, 0, 0, tzinfo=UTC)
+
+    assert schedule.next(start, max_lookahead_days=5 * 366) == datetime(2028, 2, 29, 0, 0, tzinfo=UTC)
+
+
+def test_cron_schedule_iter_agrees_with_minute_scan() -> None:
+    """Field-jumping iteration yields exactly the minutes a brute-force matches() scan accepts."""
+    start = datetime(2025, 2, 27, 22, 0, tzinfo=UTC)
+    minutes = [start + timedelta(minutes=offset) for offset in range(3 * 24 * 60)]
+    end = minutes[-1]
+
+    for expression in ("*/7 */5 * * *", "0,30 23 28-31 * *", "15 0 1 MAR SUN", "* 0 * * 6"):
+        schedule = CronSchedule.from_exp(expression)
+        expected = [when for when in minutes if schedule.matches(when)]
+        beats: list[datetime] = []
+        for beat in schedule.iter(start, inclusive=True):
+            if beat > end:
+                break
+            beats.append(beat)
+        assert beats == expected, expression
+
+
+def test_cron_schedule_survives_pickle_and_deepcopy() -> None:
+    """Schedules round-trip through pickle and deepcopy with their matching intact."""
+    schedule = parse_cron("*/5 1 * * MON")
+    when = datetime(2025, 1, 6, 1, 10, tzinfo=UTC)
+
+    for clone in (pickle.loads(pickle.dumps(schedule)), copy.deepcopy(schedule)):  # noqa: S301 - trusted payload
+        assert clone == schedule
+        assert clone.matches(when)
+        assert not clone.matches(when + timedelta(minutes=1))
+        assert clone.next(when) == schedule.next(when)
+
+
+def test_cron_schedule_next_handles_unsorted_and_empty_direct_fields() -> None:
+    """Directly constructed schedules may list values in any order; an empty field simply never matches."""
+    every_day, every_month, every_weekday = tuple(range(1, 32)), tuple(range(1, 13)), tuple(range(7))
+    unsorted = CronSchedule((30, 0), (5, 0), every_day, (12, 1), every_weekday)
+    empty = CronSchedule((), (0,), every_day, every_month, every_weekday)
+
+    assert unsorted.next(datetime(2025, 1, 1, 0, 45, tzinfo=UTC)) == datetime(2025, 1, 1, 5, 0, tzinfo=UTC)
+    assert unsorted.next(datetime(2025, 1, 31, 5, 30, tzinfo=UTC)) == datetime(2025, 12, 1, 0, 0, tzinfo=UTC)
+    with pytest.raises(ValueError, match="No matching time within 3 days"):
+        empty.next(datetime(2025, 1, 1, tzinfo=UTC), max_lookahead_days=3)
@@ -10,10 +10,13 @@
 from __future__ import annotations
 
 import base64
-from datetime import UTC, datetime, timedelta
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone, tzinfo
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, override
 
 import pytest
 
@@ -40,6 +43,15 @@ from hv_utils.parse_env import (
 )
 from hv_utils.parse_str import parse_bool, parse_int
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SECRET_B64 = base64.b64encode(b"secret").decode()
+_MISSING_VALUE_PATTERN = re.compile(r"Value is missing for 'MISSING'")
+_INVALID_OOPS_PATTERN = re.compile(r"Invalid value for 'INVALID': 'oops'")
+_INVALID_COUNT_PATTERN = re.compile(r"Invalid value for 'COUNT': 'five'")
+_INVALID_COLOR_PATTERN = re.compile(r"Invalid value for 'COLOR': 'green'")
+
 
 class Color(Enum):
     """Sample enum for env parsing tests."""
@@ -108,23 +120,18 @@ def test_get_env_handles_type_error_from_cast() -> None:
 
 def test_get_env_raises_for_missing_and_invalid_values() -> None:
     """get_env raises descriptive errors for missing or invalid values."""
-    with pytest.raises(ValueError, match="Value is missing for 'MISSING'"):
+    with pytest.raises(ValueError, match=_MISSING_VALUE_PATTERN):
         get_env("MISSING", cast=int, env={})
 
-    with pytest.raises(ValueError, match="Invalid value for 'INVALID': 'oops'"):
+    with pytest.raises(ValueError, match=_INVALID_OOPS_PATTERN):
         get_env("INVALID", cast=int, env={"INVALID": "oops"})
 
 
-def test_env_str_returns_default_when_missing() -> None:
-    """env_str returns default when the variable is absent."""
-    assert env_str("NAME", default="guest", env={}) == "guest"
-
-
 def test_env_bool_honors_required_flag() -> None:
     """env_bool raises when required value is missing."""
     env = {"ENABLED": "true"}
     assert env_bool("ENABLED", required=True, env=env) is True
-    with pytest.raises(ValueError, match="Value is missing for 'MISSING'"):
+    with pytest.raises(ValueError, match=_MISSING_VALUE_PATTERN):
         env_bool("MISSING", required=True, env={})
 
 
@@ -132,7 +139,7 @@ def test_env_int_parses_integers_or_raises() -> None:
     """env_int parses integer strings and raises on invalid input."""
     env = {"COUNT": "5"}
     assert env_int("COUNT", required=True, env=env) == 5  # noqa: PLR2004
-    with pytest.raises(ValueError, match="Invalid value for 'COUNT': 'five'"):
+    with pytest.raises(ValueError, match=_INVALID_COUNT_PATTERN):
         env_int("COUNT", required=True, env={"COUNT": "five"})
 
 
@@ -140,86 +147,127 @@ def test_env_enum_resolves_member_values() -> None:
     """env_enum resolves Enum members by value."""
     env = {"COLOR": "red"}
     assert env_enum("COLOR", Color, required=True, env=env) is Color.RED
-    with pytest.raises(ValueError, match="Invalid value for 'COLOR': 'green'"):
+    with pytest.raises(ValueError, match=_INVALID_COLOR_PATTERN):
         env_enum("COLOR", Color, required=True, env={"COLOR": "green"})
 
 
-def test_env_float_returns_default_when_missing() -> None:
-    """env_float returns provided default when variable is missing."""
-    assert env_float("RATIO", default=1.5, env={}) == 1.5  # noqa: PLR2004
-
-
-def test_env_decimal_returns_default_when_missing() -> None:
-    """env_decimal falls back to default when the variable is absent."""
-    assert env_decimal("PRICE", default=Decimal("9.99"), env={}) == Decimal("9.99")
-
-
-def test_env_path_returns_default_path() -> None:
-    """env_path returns default Path when value is missing."""
-    assert env_path("HOME", default=Path("/tmp"), env={}) == Path("/tmp")  # noqa: S108 - test only
-
-
-def test_env_url_respects_default_none() -> None:
-    """env_url returns None when default is explicitly None."""
-    assert env_url("SERVICE_URL", default=None, env={}) is None
-
+@pytest.mark.parametrize(
+    ("helper", "kwargs", "expected"),
+    [
+        pytest.param(env_str, {"name": "NAME", "default": "guest", "env": {}}, "guest", id="str-default"),
+        pytest.param(env_float, {"name": "RATIO", "default": 1.5, "env": {}}, 1.5, id="float-default"),
+        pytest.param(
+            env_decimal,
+            {"name": "PRICE", "default": Decimal("9.99"), "env": {}},
+            Decimal("9.99"),
+            id="decimal-default",
+        ),
+        pytest.param(
+            env_path,
+            {"name": "HOME", "default": Path("/tmp"), "env": {}},  # noqa: S108 - test only
+            Path("/tmp"),  # noqa: S108 - test only
+            id="path-default",
+        ),
+        pytest.param(env_url, {"name": "SERVICE_URL", "default": None, "env": {}}, None, id="url-default-none"),
+        pytest.param(
+            env_datetime,
+            {"name": "START", "env": {"START": "2025-01-01T00:00:00"}, "tzinfo": UTC},
+            datetime(2025, 1, 1, tzinfo=UTC),
+            id="datetime-applies-tzinfo",
+        ),
+        pytest.param(
+            env_timedelta,
+            {"name": "INTERVAL", "env": {"INTERVAL": "15m"}},
+            timedelta(minutes=15),
+            id="timedelta-duration",
+        ),
+        pytest.param(env_list, {"name": "LIST", "env": {"LIST": "a,b,c"}}, ["a", "b", "c"], id="list"),
+        pytest.param(
+            env_set,
+            {"name": "SET", "env": {"SET": "1;2;3"}, "sep": ";", "item_cast": int},
+            {1, 2, 3},
+            id="set-typed",
+        ),
+        pytest.param(
+            env_mapping,
+            {"name": "MAP", "env": {"MAP": "k1=v1,k2=v2"}},
+            {"k1": "v1", "k2": "v2"},
+            id="mapping",
+        ),
+        pytest.param(env_json, {"name": "CONFIG", "env": {"CONFIG": '{"debug": true}'}}, {"debug": True}, id="json"),
+        pytest.param(
+            env_base64_bytes,
+            {"name": "SECRET", "env": {"SECRET": _SECRET_B64}},
+            b"secret",
+            id="base64-bytes",
+        ),
+        pytest.param(
+            env_base64_str,
+            {"name": "SECRET", "env": {"SECRET": _SECRET_B64}},
+            "secret",
+            id="base64-str",
+        ),
+    ],
+)
+def test_env_happy_path(helper: Callable[..., object], kwargs: dict[str, Any], expected: object) -> None:
+    """env_* helpers parse present values and fall back to defaults when missing."""
+    assert helper(**kwargs) == expected
 
-def test_env_datetime_applies_tzinfo() -> None:
-    """env_datetime parses timestamps and attaches tzinfo when naive."""
-    env = {"START": "2025-01-01T00:00:00"}
-    start = env_datetime("START", env=env, tzinfo=UTC)
-    assert start == datetime(2025, 1, 1, tzinfo=UTC)
 
+def test_env_or_none_returns_none_on_missing_or_invalid() -> None:
+    """env_or_none returns None for missing or invalid values."""
+    assert env_or_none("OPTIONAL", cast=str, env={}) is None
+    assert env_or_none("OPTIONAL", cast=parse_int, env={"OPTIONAL": "oops"}) is None
 
-def test_env_timedelta_parses_duration_strings() -> None:
-    """env_timedelta converts duration strings to timedeltas."""
-    env = {"INTERVAL": "15m"}
-    assert env_timedelta("INTERVAL", env=env) == timedelta(minutes=15)
 
+def test_env_or_default_returns_default_on_missing_or_invalid() -> None:
+    """env_or_default returns the default for missing or invalid values."""
+    assert env_or_default("TIMEOUT", cast=parse_int, default=30, env={}) == 30  # noqa: PLR2004
+    assert env_or_default("TIMEOUT", cast=parse_int, default=30, env={"TIMEOUT": "oops"}) == 30  # noqa: PLR2004
 
-def test_env_list_parses_collection_values() -> None:
-    """env_list splits comma-separated values into a list."""
-    env = {"LIST": "a,b,c"}
-    assert env_list("LIST", env=env) == ["a", "b", "c"]
 
+@dataclass
+class _ScaledInt:
+    """Callable item cast that is unhashable, as non-frozen dataclasses with ``eq`` are."""
 
-def test_env_set_parses_typed_collection_values() -> None:
-    """env_set parses separated tokens into a typed set."""
-    env = {"SET": "1;2;3"}
-    assert env_set("SET", env=env, sep=";", item_cast=int) == {1, 2, 3}
+    factor: int
 
+    def __call__(self, raw: str) -> int:
+        return int(raw) * self.factor
 
-def test_env_mapping_parses_key_value_pairs() -> None:
-    """env_mapping parses delimited key-value pairs."""
-    env = {"MAP": "k1=v1,k2=v2"}
-    assert env_mapping("MAP", env=env) == {"k1": "v1", "k2": "v2"}
 
+def test_env_list_and_set_accept_unhashable_item_cast() -> None:
+    """Collection helpers work with item casts that cannot be used as cache keys."""
+    scale = _ScaledInt(factor=10)
+    assert env_list("LIST", item_cast=scale, env={"LIST": "1,2"}) == [10, 20]
+    assert env_set("SET", item_cast=scale, env={"SET": "1,1,3"}) == {10, 30}
 
-def test_env_json_parses_json_payloads() -> None:
-    """env_json returns parsed JSON structures."""
-    env = {"CONFIG": '{"debug": true}'}
-    assert env_json("CONFIG", env=env) == {"debug": True}
 
+class _UnhashableZone(tzinfo):
+    """Fixed-offset zone without a hash, as some third-party tzinfo implementations are."""
 
-def test_env_base64_bytes_decodes_bytes_payload() -> None:
-    """env_base64_bytes decodes base64 content into bytes."""
-    env = {"SECRET": base64.b64encode(b"secret").decode()}
-    assert env_base64_bytes("SECRET", env=env) == b"secret"
+    __hash__ = None  # type: ignore[assignment]
 
+    @override
+    def utcoffset(self, dt: datetime | None) -> timedelta:
+        return timedelta(hours=3)
 
-def test_env_base64_str_decodes_text_payload() -> None:
-    """env_base64_str decodes base64 content into text."""
-    env = {"SECRET": base64.b64encode(b"secret").decode()}
-    assert env_base64_str("SECRET", env=env) == "secret"
+    @override
+    def tzname(self, dt: datetime | None) -> str:
+        return "UNHASHABLE"
 
+    @override
+    def dst(self, dt: datetime | None) -> timedelta:
+        return timedelta(0)
 
-def test_env_or_none_returns_none_on_missing_or_invalid() -> None:
-    """env_or_none returns None for missing or invalid values."""
-    assert env_or_none("OPTIONAL", cast=str, env={}) is None
-    assert env_or_none("OPTIONAL", cast=parse_int, env={"OPTIONAL": "oops"}) is None
 
+def test_env_datetime_keeps_each_tzinfo_distinct() -> None:
+    """Zones with equal offsets are not conflated, and unhashable zones are accepted."""
+    env = {"WHEN": "2025-01-02T03:04:05"}
+    alpha = timezone(timedelta(hours=2), "ALPHA")
+    beta = timezone(timedelta(hours=2), "BETA")
 
-def test_env_or_default_returns_default_on_missing_or_invalid() -> None:
-    """env_or_default returns the default for missing or invalid values."""
-    assert env_or_default("TIMEOUT", cast=parse_int, default=30, env={}) == 30  # noqa: PLR2004
-    assert env_or_default("TIMEOUT", cast=parse_int, default=30, env={"TIMEOUT": "oops"}) == 30  # noqa: PLR2004
+    for zone, zone_name in ((alpha, "ALPHA"), (beta, "BETA"), (_UnhashableZone(), "UNHASHABLE")):
+        parsed = env_datetime("WHEN", tzinfo=zone, env=env)
+        assert parsed is not None
+        assert parsed.tzname() == zone_name
@@ -13,23 +13,46 @@
 from __future__ import annotations
 
 import datetime
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import pytest
-from freezegun import freeze_time
 
-from hv_utils.expiration import ExpiresAfter, ExpiresAtDT, ExpiresAtTS, ExpiresIn
+from hv_utils.expiration import Expiration, ExpiresAfter, ExpiresAtDT, ExpiresAtTS, ExpiresIn
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def test_expires_in_uses_current_time() -> None:
+type FreezeNow = Callable[[datetime.datetime], None]
+
+_TZ_PLUS_2 = datetime.timezone(datetime.timedelta(hours=2))
+_TZ_MINUS_5 = datetime.timezone(datetime.timedelta(hours=-5))
+
+
+@pytest.fixture
+def freeze_now(monkeypatch: pytest.MonkeyPatch) -> FreezeNow:
+    """Pin the clock read by :mod:`hv_utils.expiration` to a fixed moment.
+
+    Returns:
+        FreezeNow: Callable that freezes the module clock at the given datetime.
+
+    """
+
+    def _freeze(moment: datetime.datetime) -> None:
+        timestamp = moment.timestamp()
+        monkeypatch.setattr("hv_utils.expiration._now", lambda: timestamp)
+
+    return _freeze
+
+
+def test_expires_in_uses_current_time(freeze_now: FreezeNow) -> None:
     """ExpiresIn computes expiration relative to the call time."""
     fixed_now = datetime.datetime(2025, 1, 1, 12, 0, tzinfo=datetime.UTC)
     ttl = datetime.timedelta(seconds=30)
-    with freeze_time(fixed_now):
-        expires_in = ExpiresIn(ttl)
+    freeze_now(fixed_now)
+    expires_in = ExpiresIn(ttl)
 
-        timestamp = expires_in.as_timestamp()
-        as_datetime = expires_in.as_datetime()
+    timestamp = expires_in.as_timestamp()
+    as_datetime = expires_in.as_datetime()
 
     expected_expiration = fixed_now + ttl
     assert timestamp == expected_expiration.timestamp()
@@ -46,20 +69,19 @@ def test_expires_after_enforces_timezone_awareness() -> None:
         ExpiresAfter(datetime.timedelta(seconds=10), naive_since)
 
 
-def test_expires_after_remaining_ttl_clamps_to_zero() -> None:
+def test_expires_after_remaining_ttl_clamps_to_zero(freeze_now: FreezeNow) -> None:
     """ExpiresAfter clamps negative remaining TTL to zero and converts timezones."""
     fixed_now = datetime.datetime(2025, 1, 1, 12, 0, tzinfo=datetime.UTC)
     ttl = datetime.timedelta(seconds=5)
     since = fixed_now - datetime.timedelta(seconds=10)
     expires_after = ExpiresAfter(ttl, since)
 
-    target_tz = datetime.timezone(datetime.timedelta(hours=2))
-    expected_expiration = (since + ttl).astimezone(target_tz)
+    expected_expiration = (since + ttl).astimezone(_TZ_PLUS_2)
 
-    with freeze_time(fixed_now):
-        assert expires_after.as_timestamp() == pytest.approx((since + ttl).timestamp())
-        assert expires_after.as_datetime(target_tz) == expected_expiration
-        assert expires_after.as_ttl() == datetime.timedelta(0)
+    freeze_now(fixed_now)
+    assert expires_after.as_timestamp() == pytest.approx((since + ttl).timestamp())
+    assert expires_after.as_datetime(_TZ_PLUS_2) == expected_expiration
+    assert expires_after.as_ttl() == datetime.timedelta(0)
 
 
 def test_expires_at_ts_enforces_non_negative_timestamp() -> None:
@@ -68,18 +90,17 @@ def test_expires_at_ts_enforces_non_negative_timestamp() -> None:
         ExpiresAtTS(-1.0)
 
 
-def test_expires_at_ts_returns_remaining() -> None:
+def test_expires_at_ts_returns_remaining(freeze_now: FreezeNow) -> None:
     """ExpiresAtTS reports remaining TTL relative to the frozen current time."""
     fixed_now = datetime.datetime(2025, 1, 1, 8, 0, tzinfo=datetime.UTC)
     remaining_seconds: Final[float] = 42.5
-    expires_at = ExpiresAtTS(fixed_now.timestamp() + remaining_seconds)
+    expiration_ts = fixed_now.timestamp() + remaining_seconds
+    expires_at = ExpiresAtTS(expiration_ts)
 
-    with freeze_time(fixed_now):
-        assert expires_at.as_datetime(datetime.UTC) == datetime.datetime.fromtimestamp(
-            expires_at.as_timestamp(),
-            tz=datetime.UTC,
-        )
-        assert expires_at.as_ttl() == datetime.timedelta(seconds=remaining_seconds)
+    freeze_now(fixed_now)
+    assert expires_at.as_timestamp() == expiration_ts
+    assert expires_at.as_datetime(datetime.UTC) == datetime.datetime.fromtimestamp(expiration_ts, tz=datetime.UTC)
+    assert expires_at.as_ttl() == datetime.timedelta(seconds=remaining_seconds)
 
 
 def test_expires_at_dt_requires_timezone() -> None:
@@ -90,15 +111,36 @@ def test_expires_at_dt_requires_timezone() -> None:
         ExpiresAtDT(naive_expiration)
 
 
-def test_expires_at_dt_reports_remaining() -> None:
+def test_expires_at_dt_reports_remaining(freeze_now: FreezeNow) -> None:
     """ExpiresAtDT exposes timestamp, datetime conversion, and remaining TTL."""
     expiration_dt = datetime.datetime(2025, 6, 1, 10, 0, tzinfo=datetime.UTC)
     fixed_now = expiration_dt - datetime.timedelta(seconds=1)
     expires_at = ExpiresAtDT(expiration_dt)
 
-    target_tz = datetime.timezone(datetime.timedelta(hours=-5))
-
-    with freeze_time(fixed_now):
-        assert expires_at.as_timestamp() == expiration_dt.timestamp()
-        assert expires_at.as_datetime(target_tz) == expiration_dt.astimezone(target_tz)
-        assert expires_at.as_ttl() == datetime.timedelta(seconds=1)
+    freeze_now(fixed_now)
+    assert expires_at.as_timestamp() == expiration_dt.timestamp()
+    assert expires_at.as_datetime(_TZ_MINUS_5) == expiration_dt.astimezone(_TZ_MINUS_5)
+    assert expires_at.as_ttl() == datetime.timedelta(seconds=1)
+
+
+@pytest.mark.parametrize(
+    "expiration",
+    [
+        pytest.param(ExpiresIn(datetime.timedelta(seconds=1)), id="expires-in"),
+        pytest.param(
+            ExpiresAfter(datetime.timedelta(seconds=1), datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)),
+            id="expires-after",
+        ),
+        pytest.param(ExpiresAtTS(0.0), id="expires-at-ts"),
+        pytest.param(ExpiresAtDT(datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)), id="expires-at-dt"),
+    ],
+)
+def test_expirations_use_slots(expiration: object) -> None:
+    """Expiration implementations do not carry a per-instance ``__dict__``."""
+    assert not hasattr(expiration, "__dict__")
+
+
+def test_expiration_interface_cannot_be_instantiated() -> None:
+    """Expiration stays an abstract base so incomplete implementations fail fast."""
+    with pytest.raises(TypeError, match="abstract"):
+        Expiration()  # ty: ignore[call-non-callable]
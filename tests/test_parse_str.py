@@ -11,10 +11,12 @@ from __future__ import annotations
 
 import base64
 import math
+import re
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from enum import Enum
+from enum import Enum, EnumType
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import ParseResult
 
 import pytest
@@ -39,6 +41,11 @@ from hv_utils.parse_str import (
     parse_url,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_HELLO_B64 = base64.b64encode(b"hello").decode()
+
 
 class Color(Enum):
     """Simple enum for color parsing tests."""
@@ -47,61 +54,117 @@ class Color(Enum):
     BLUE = "blue"
 
 
-def test_parse_bool_accepts_truthy_and_falsy_tokens() -> None:
-    """parse_bool handles canonical truthy/falsy tokens and rejects invalid values."""
-    assert parse_bool("TRUE") is True
-    assert parse_bool("0") is False
-    with pytest.raises(ValueError, match="Invalid boolean literal: 'maybe'"):
-        parse_bool("maybe")
-
-
-def test_parse_int_requires_integer_strings() -> None:
-    """parse_int converts valid integers and rejects non-integer inputs."""
-    assert parse_int("10") == 10  # noqa: PLR2004
-    with pytest.raises(ValueError, match=r"Invalid integer literal: '10\.5'"):
-        parse_int("10.5")
+@pytest.mark.parametrize(
+    ("parser", "value", "kwargs", "expected"),
+    [
+        pytest.param(parse_bool, "TRUE", {}, True, id="bool-true"),
+        pytest.param(parse_bool, "0", {}, False, id="bool-false"),
+        pytest.param(parse_bool, "tRuE", {}, True, id="bool-mixed-case"),
+        pytest.param(parse_bool, "  Off\n", {}, False, id="bool-padded"),
+        pytest.param(parse_bool, "Yes", {}, True, id="bool-title-case"),
+        pytest.param(parse_int, "10", {}, 10, id="int"),
+        pytest.param(parse_int, " 42\n", {}, 42, id="int-padded"),
+        pytest.param(parse_decimal, "2.50", {}, Decimal("2.50"), id="decimal"),
+        pytest.param(parse_decimal, "  1.25 ", {}, Decimal("1.25"), id="decimal-padded"),
+        pytest.param(parse_enum, "RED", {"enum_type": Color}, Color.RED, id="enum-name"),
+        pytest.param(parse_enum, "blue", {"enum_type": Color}, Color.BLUE, id="enum-value"),
+        pytest.param(parse_enum, "  RED  ", {"enum_type": Color}, Color.RED, id="enum-padded"),
+        pytest.param(parse_timedelta, "10s", {}, timedelta(seconds=10), id="timedelta-seconds"),
+        pytest.param(parse_timedelta, "2h", {}, timedelta(hours=2), id="timedelta-hours"),
+        pytest.param(parse_bytes_size, "10MB", {}, 10_000_000, id="size-decimal-unit"),
+        pytest.param(parse_bytes_size, "1Gi", {}, 1024**3, id="size-binary-unit"),
+        pytest.param(parse_bytes_size, "1.5KB", {}, 1_500, id="size-fraction"),
+        pytest.param(parse_bytes_size, " 0.5 Ki ", {}, 512, id="size-padded-fraction"),
+        pytest.param(parse_bytes_size, "2.0B", {}, 2, id="size-whole-fraction"),
+        pytest.param(parse_set, "1|2|3", {"sep": "|", "item_cast": int}, {1, 2, 3}, id="set-cast"),
+        pytest.param(parse_json, '{"a":1}', {}, {"a": 1}, id="json"),
+        pytest.param(parse_json_typed, "1", {}, 1, id="json-typed"),
+        pytest.param(parse_base64_bytes, _HELLO_B64, {}, b"hello", id="base64-bytes"),
+        pytest.param(parse_base64_str, _HELLO_B64, {}, "hello", id="base64-str"),
+        pytest.param(parse_base64_bytes, "aGVs\nbG8=", {"validate": False}, b"hello", id="base64-bytes-lenient"),
+        pytest.param(parse_base64_str, "aGVs\nbG8=", {"validate": False}, "hello", id="base64-str-lenient"),
+        pytest.param(parse_path, "/tmp/data", {}, Path("/tmp/data"), id="path"),  # noqa: S108 - test only
+    ],
+)
+def test_parser_accepts_valid_literals(
+    parser: Callable[..., object],
+    value: str,
+    kwargs: dict[str, Any],
+    expected: object,
+) -> None:
+    """Parsers convert valid literals, including padded and unusually cased ones, to the expected type."""
+    result = parser(value, **kwargs)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    ("parser", "value", "kwargs", "pattern"),
+    [
+        pytest.param(parse_bool, "maybe", {}, re.compile(r"Invalid boolean literal: 'maybe'"), id="bool"),
+        pytest.param(parse_int, "10.5", {}, re.compile(r"Invalid integer literal: '10\.5'"), id="int"),
+        pytest.param(parse_float, "abc", {}, re.compile(r"Invalid float literal: 'abc'"), id="float"),
+        pytest.param(parse_decimal, "abc", {}, re.compile(r"Invalid decimal literal: 'abc'"), id="decimal"),
+        pytest.param(
+            parse_enum, "green", {"enum_type": Color}, re.compile(r"Invalid Color literal: 'green'"), id="enum"
+        ),
+        pytest.param(
+            parse_url,
+            "example.com/path",
+            {},
+            re.compile(r"Invalid URL \(missing scheme\): 'example\.com/path'"),
+            id="url-missing-scheme",
+        ),
+        pytest.param(parse_timedelta, "5w", {}, re.compile(r"Invalid duration literal: '5w'"), id="timedelta-unit"),
+        pytest.param(
+            parse_bytes_size, "1.5B", {}, re.compile(r"Size must resolve to whole bytes: '1\.5B'"), id="size-fraction"
+        ),
+        pytest.param(parse_bytes_size, "10XB", {}, re.compile(r"Unknown size unit in '10XB'"), id="size-unit"),
+        pytest.param(parse_list, "a,,b", {}, re.compile(r"Empty item in separated list: 'a,,b'"), id="list-empty-item"),
+        pytest.param(
+            parse_set,
+            "1||2",
+            {"sep": "|", "item_cast": int},
+            re.compile(r"Empty item in separated list: '1\|\|2'"),
+            id="set-empty-item",
+        ),
+        pytest.param(parse_mapping, "=value", {}, re.compile(r"Empty key in pair '=value'"), id="mapping-empty-key"),
+        pytest.param(parse_json, "{invalid}", {}, re.compile(r"Expecting property name"), id="json"),
+        pytest.param(parse_json_typed, "{", {}, re.compile(r"Expecting property name"), id="json-typed"),
+        pytest.param(
+            parse_base64_bytes, "not-base64", {}, re.compile(r"Invalid base64 literal: 'not-base64'"), id="base64-bytes"
+        ),
+        pytest.param(
+            parse_base64_bytes, "aGVs\nbG8=", {}, re.compile(r"Invalid base64 literal"), id="base64-bytes-strict"
+        ),
+        pytest.param(parse_base64_str, "bad%%", {}, re.compile(r"Invalid base64 literal: 'bad%%'"), id="base64-str"),
+    ],
+)
+def test_parser_rejects_invalid_literals(
+    parser: Callable[..., object],
+    value: str,
+    kwargs: dict[str, Any],
+    pattern: re.Pattern[str],
+) -> None:
+    """Parsers raise ValueError with a message naming the rejected literal."""
+    with pytest.raises(ValueError, match=pattern):
+        parser(value, **kwargs)
 
 
 def test_parse_float_accepts_decimal_strings() -> None:
-    """parse_float returns floating-point values for decimal strings."""
+    """parse_float returns floating-point values for decimal and special strings."""
     assert parse_float("3.14") == pytest.approx(math.pi, abs=0.002)  # Near Pi
+    assert parse_float("\t2.5 ") == pytest.approx(2.5)
     assert math.isnan(parse_float("nan"))
     assert math.isinf(parse_float("inf"))
     assert math.isinf(parse_float("-inf"))
-    with pytest.raises(ValueError, match="Invalid float literal: 'abc'"):
-        parse_float("abc")
-
-
-def test_parse_decimal_preserves_precision() -> None:
-    """parse_decimal returns Decimal values and rejects invalid input."""
-    assert parse_decimal("2.50") == Decimal("2.50")
-    with pytest.raises(ValueError, match="Invalid decimal literal: 'abc'"):
-        parse_decimal("abc")
-
-
-def test_parse_enum_accepts_names_and_values() -> None:
-    """parse_enum resolves enum members by name or value."""
-    assert parse_enum("RED", Color) is Color.RED
-    assert parse_enum("blue", Color) is Color.BLUE
-    assert parse_enum("  RED  ", Color) is Color.RED
-    with pytest.raises(ValueError, match="Invalid Color literal: 'green'"):
-        parse_enum("green", Color)
 
 
 def test_parse_url_requires_scheme() -> None:
-    """parse_url parses URLs with schemes and rejects missing schemes."""
+    """parse_url returns a ParseResult for URLs with a scheme."""
     result = parse_url("https://example.com/path")
     assert isinstance(result, ParseResult)
-    with pytest.raises(ValueError, match=r"Invalid URL \(missing scheme\): 'example\.com/path'"):
-        parse_url("example.com/path")
-
-
-def test_parse_timedelta_supports_time_units() -> None:
-    """parse_timedelta accepts second, minute, hour, and day suffixes."""
-    assert parse_timedelta("10s") == timedelta(seconds=10)
-    assert parse_timedelta("2h") == timedelta(hours=2)
-    with pytest.raises(ValueError, match="Invalid duration literal: '5w'"):
-        parse_timedelta("5w")
+    assert result.netloc == "example.com"
 
 
 def test_parse_datetime_applies_default_tzinfo() -> None:
@@ -112,68 +175,35 @@ def test_parse_datetime_applies_default_tzinfo() -> None:
     assert aware.tzinfo is UTC
 
 
-def test_parse_bytes_size_accepts_decimal_and_binary_units() -> None:
-    """parse_bytes_size converts decimal and binary unit suffixes."""
-    ten_megabytes = 10_000_000
-    assert parse_bytes_size("10MB") == ten_megabytes
-    assert parse_bytes_size("1Gi") == 1024**3
-    with pytest.raises(ValueError, match=r"Size must resolve to whole bytes: '1\.5B'"):
-        parse_bytes_size("1.5B")
-    with pytest.raises(ValueError, match=r"Unknown size unit in '10XB'"):
-        parse_bytes_size("10XB")
-
-
 def test_parse_list_splits_values_with_separator() -> None:
     """parse_list splits a string into a list using the provided separator."""
     assert parse_list("a,b,c") == ["a", "b", "c"]
-    with pytest.raises(ValueError, match="Empty item in separated list: 'a,,b'"):
-        parse_list("a,,b")
-
-
-def test_parse_set_casts_items_and_respects_separator() -> None:
-    """parse_set converts separated tokens to a set using the given cast."""
-    assert parse_set("1|2|3", sep="|", item_cast=int) == {1, 2, 3}
-    with pytest.raises(ValueError, match="Empty item in separated list: '1\\|\\|2'"):
-        parse_set("1||2", sep="|", item_cast=int)
 
 
 def test_parse_mapping_reads_key_value_pairs() -> None:
     """parse_mapping parses mappings separated by pair and kv delimiters."""
     assert parse_mapping("k1=v1,k2=v2") == {"k1": "v1", "k2": "v2"}
-    with pytest.raises(ValueError, match="Empty key in pair '=value'"):
-        parse_mapping("=value")
-
-
-def test_parse_json_returns_parsed_object() -> None:
-    """parse_json loads JSON payloads from strings."""
-    assert parse_json('{"a":1}') == {"a": 1}
-    with pytest.raises(ValueError, match="Expecting property name"):
-        parse_json("{invalid}")
 
 
-def test_parse_json_typed_enforces_loader_errors() -> None:
-    """parse_json_typed returns typed results and raises on invalid JSON."""
-    assert parse_json_typed("1") == 1
-    with pytest.raises(ValueError, match="Expecting property name"):
-        parse_json_typed("{")
+def test_parse_json_returns_independent_containers() -> None:
+    """Repeated parses of the same object or array never share state through the parse cache."""
+    first = parse_json('{"flags": ["a"]}')
+    assert isinstance(first, dict)
+    first["flags"] = []
 
+    assert parse_json('{"flags": ["a"]}') == {"flags": ["a"]}
+    assert parse_json_typed("[1, 2]") is not parse_json_typed("[1, 2]")
 
-def test_parse_base64_bytes_decodes_payload() -> None:
-    """parse_base64_bytes decodes base64 strings into bytes."""
-    payload = base64.b64encode(b"hello").decode()
-    assert parse_base64_bytes(payload) == b"hello"
-    with pytest.raises(ValueError, match="Invalid base64 literal: 'not-base64'"):
-        parse_base64_bytes("not-base64")
 
+def test_parse_enum_resolves_members_without_iterating_the_enum(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Once the per-class index is built, names and values resolve by lookup rather than a scan over members."""
+    parse_enum("RED", Color)
 
-def test_parse_base64_str_decodes_payload() -> None:
-    """parse_base64_str decodes base64 strings into text."""
-    payload = base64.b64encode(b"hello").decode()
-    assert parse_base64_str(payload) == "hello"
-    with pytest.raises(ValueError, match="Invalid base64 literal: 'bad%%'"):
-        parse_base64_str("bad%%")
+    def _no_iteration(_cls: type[Enum]) -> Iterator[Enum]:
+        message = "parse_enum iterated the enum members"
+        raise AssertionError(message)
 
+    monkeypatch.setattr(EnumType, "__iter__", _no_iteration)
 
-def test_parse_path_returns_path_object() -> None:
-    """parse_path converts string paths to Path instances."""
-    assert parse_path("/tmp/data") == Path("/tmp/data")  # noqa: S108 - test only
+    assert parse_enum("RED", Color) is Color.RED
+    assert parse_enum("blue", Color) is Color.BLUE
@@ -21,6 +21,17 @@ import pytest
 from hv_utils.sentinel import MISSING
 
 
+@pytest.fixture(scope="session")
+def missing_pickle_bytes() -> bytes:
+    """Pickle the sentinel once for every test that checks round-trips.
+
+    Returns:
+        bytes: Pickled form of ``MISSING``.
+
+    """
+    return pickle.dumps(MISSING)
+
+
 def test_missing_attribute_access_is_forbidden() -> None:
     """Missing raises when accessed or mutated like a normal object."""
     assert bool(MISSING) is False
@@ -33,6 +44,12 @@ def test_missing_attribute_access_is_forbidden() -> None:
         delattr(MISSING, "value")
 
 
+def test_missing_unknown_attribute_error_names_attribute() -> None:
+    """Unknown attribute lookups report the attribute name in the error."""
+    with pytest.raises(AttributeError, match="Missing sentinel has no attribute 'value'"):
+        _ = MISSING.value
+
+
 def test_missing_behaves_like_any_for_type_checkers() -> None:
     """MISSING is annotated as Any to satisfy strict type checks."""
 
@@ -71,9 +88,9 @@ def test_missing_dataclass_defaults_are_distinguishable() -> None:
     assert MISSING.__class__.__name__ == "MissingType"
 
 
-def test_missing_supports_pickle_and_copy() -> None:
+def test_missing_supports_pickle_and_copy(missing_pickle_bytes: bytes) -> None:
     """Pickling and copying preserve the singleton identity."""
-    assert pickle.loads(pickle.dumps(MISSING)) is MISSING  # noqa: S301 - required for testing, nothing danger here
+    assert pickle.loads(missing_pickle_bytes) is MISSING  # noqa: S301 - required for testing, nothing danger here
     assert copy(MISSING) is MISSING
     assert copy(MISSING) is MISSING
 
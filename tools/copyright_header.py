@@ -14,15 +14,19 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+import re
 import sys
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
 DEFAULT_EXCLUDE_DIRS = {".git", ".idea", ".venv", ".mypy_cache", ".ruff_cache", "__pycache__"}
 HEADER_TEMPLATE = """# -----------------------------------------------------------------------------
@@ -35,10 +39,17 @@ HEADER_TEMPLATE = """# ---------------------------------------------------------
 #  Contributions:
 {contributions}
 # -----------------------------------------------------------------------------"""
+HEADER_RULE = b"# ---"
+# Headers sit at the top of a file, so this many leading bytes are enough to tell whether one is present.
+HEADER_SCAN_LIMIT = 4096
 CONTRIBUTION_INDENT = "     "
-MIN_COPYRIGHT_PARTS = 4
 ENCODING = "utf-8"
+# Prefix reads are I/O bound and release the GIL, so the pool is sized well past the CPU count.
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 LOGGER = logging.getLogger("tools.copyright_header")
+_HEADER_RULE_RE = re.compile(rb"^# ---", re.MULTILINE)
+_COPYRIGHT_RE = re.compile(rb"#*\s*Copyright \(c\)\s+(\d+)\s+(.+?)\s*$")
+_METADATA_RE = re.compile(rb"(?:#![^\n]*\n?)?(?:# -\*- coding:[^\n]*\n?)?")
 
 
 @dataclass(frozen=True)
@@ -48,12 +59,15 @@ class HeaderConfig:
     author: str
     year: int
     project: str
-    contributions: list[str]
+    contributions: tuple[str, ...]
 
 
+@lru_cache(maxsize=16)
 def build_header(config: HeaderConfig) -> str:
     """Construct the header text using the provided configuration.
 
+    Results are memoized per configuration, so repeated programmatic runs reuse the text.
+
     Returns:
         str: Fully formatted header block ending with a newline.
 
@@ -82,97 +96,119 @@ def _iter_python_files(paths: Iterable[Path], exclude_dirs: set[str]) -> Iterabl
     for base in paths:
         if not base.exists():
             continue
-        if base.is_file() and base.suffix == ".py":
-            yield base
+        if base.is_file():
+            if base.suffix == ".py":
+                yield base
+            continue
+        if any(part in exclude_dirs for part in base.parts):
             continue
-        for candidate in base.rglob("*.py"):
-            if any(part in exclude_dirs for part in candidate.parts):
-                continue
-            yield candidate
+        for root, dirs, names in os.walk(base):
+            # Prune excluded directories in place so the walk never descends into them.
+            dirs[:] = [name for name in dirs if name not in exclude_dirs]
+            yield from (Path(root, name) for name in names if name.endswith(".py"))
+
+
+def _read_prefix(path: Path) -> bytes:
+    with path.open("rb") as handle:
+        return handle.read(HEADER_SCAN_LIMIT)
+
+
+def _without_current_header(prefixes: dict[Path, bytes], header: str) -> list[Path]:
+    header_bytes = header.encode(ENCODING)
+    return [path for path, prefix in prefixes.items() if not prefix.startswith(header_bytes)]
 
 
-def _has_header(text: str) -> bool:
-    return text.lstrip().startswith("# ---")
+def _has_header(prefix: bytes) -> bool:
+    return prefix.lstrip().startswith(HEADER_RULE)
 
 
-def _extract_header_block(body_lines: list[str]) -> tuple[str, int] | None:
-    """Return the existing header block and end index if present.
+def _extract_header_block(body: bytes) -> tuple[bytes, int] | None:
+    """Return the existing header block and the offset where its closing line ends, if present.
 
     Returns:
-        tuple[str, int] | None: Captured header text and the index of its closing line.
+        tuple[bytes, int] | None: Captured header bytes and the index in ``body`` where its closing line ends.
 
     """
-    if not body_lines or not body_lines[0].startswith("# ---"):
+    if not body.startswith(HEADER_RULE):
         return None
-    try:
-        end_idx = next(idx for idx, line in enumerate(body_lines[1:], start=1) if line.startswith("# ---"))
-    except StopIteration:
+    closing = _HEADER_RULE_RE.search(body, 1)
+    if closing is None:
         return None
-    header_block = "\n".join(body_lines[: end_idx + 1]) + "\n"
-    return header_block, end_idx
+    line_end = body.find(b"\n", closing.start())
+    if line_end == -1:
+        line_end = len(body)
+    # Keep a CRLF terminator out of the block so it stays with the body that follows.
+    if body[line_end - 1 : line_end] == b"\r":
+        line_end -= 1
+    return body[:line_end], line_end
+
+
+def _parse_copyright_line(line: bytes) -> tuple[int, str] | None:
+    match = _COPYRIGHT_RE.match(line)
+    if match is None:
+        return None
+    return int(match.group(1)), match.group(2).decode(ENCODING, errors="replace")
 
 
-def _parse_copyright_line(line: str) -> tuple[int, str] | None:
-    stripped = line.lstrip("#").strip()
-    if not stripped.startswith("Copyright (c)"):
-        return None
-    parts = stripped.split()
-    if len(parts) < MIN_COPYRIGHT_PARTS:
-        return None
-    try:
-        year = int(parts[2])
-    except ValueError:
-        return None
-    author = " ".join(parts[3:])
-    return year, author
+def _second_line(text: bytes) -> bytes | None:
+    lines = text.split(b"\n", 2)
+    return lines[1] if len(lines) > 1 else None
 
 
-def _split_leading_metadata(lines: list[str]) -> tuple[list[str], list[str]]:
-    metadata: list[str] = []
-    idx = 0
-    if lines and lines[0].startswith("#!"):
-        metadata.append(lines[0])
-        idx += 1
-    if idx < len(lines) and lines[idx].startswith("# -*- coding:"):
-        metadata.append(lines[idx])
-        idx += 1
-    return metadata, lines[idx:]
+def _split_leading_metadata(text: bytes, newline: bytes) -> tuple[bytes, bytes]:
+    match = _METADATA_RE.match(text)
+    idx = match.end() if match is not None else 0
+    metadata = text[:idx]
+    if metadata and not metadata.endswith(b"\n"):
+        metadata += newline
+    return metadata, text[idx:]
 
 
-def apply_header(files: Iterable[Path], header: str) -> list[Path]:
+def apply_header(files: Iterable[Path], header: str, *, preloaded: Mapping[Path, bytes] | None = None) -> list[Path]:
     """Apply the header to each file, returning the list of modified paths.
 
+    ``preloaded`` maps paths to their complete contents when the caller already holds them; those files are not
+    read again.
+
     Returns:
         list[Path]: Files that were updated.
 
     """
     updated: list[Path] = []
-    target_lines = header.splitlines()
+    block = header.removesuffix("\n").encode(ENCODING)
+    target_line = _second_line(block)
+    target_meta = _parse_copyright_line(target_line) if target_line is not None else None
+    blocks = {b"\n": block, b"\r\n": block.replace(b"\n", b"\r\n")}
     for path in files:
-        text = path.read_text(encoding=ENCODING)
-        lines = text.splitlines()
-        metadata, body = _split_leading_metadata(lines)
-        new_body = _prepare_body(body, target_lines, header)
-        if new_body is None:
+        raw = preloaded.get(path) if preloaded else None
+        if raw is None:
+            raw = path.read_bytes()
+        # The header follows the file's own line endings so rewritten files never mix them.
+        newline = b"\r\n" if b"\r\n" in raw[:HEADER_SCAN_LIMIT] else b"\n"
+        metadata, body = _split_leading_metadata(raw, newline)
+        new_parts = _prepare_body(body, blocks[newline], target_meta, newline)
+        if new_parts is None:
             continue
-        joined = "\n".join(metadata + new_body)
-        if text.endswith("\n"):
-            joined += "\n"
-        path.write_text(joined, encoding=ENCODING)
+        with path.open("wb") as handle:
+            handle.writelines((metadata, *new_parts))
         updated.append(path)
     return updated
 
 
-def _prepare_body(body: list[str], target_lines: list[str], header: str) -> list[str] | None:
+def _prepare_body(
+    body: bytes,
+    block: bytes,
+    target_meta: tuple[int, str] | None,
+    newline: bytes,
+) -> tuple[bytes, ...] | None:
     existing = _extract_header_block(body)
     if existing is None:
-        return [*target_lines, "", *body]
+        return (block, newline * 2, body) if body else (block, newline)
 
-    current_header, end_idx = existing
-    current_lines = body[: end_idx + 1]
-    target_meta = _parse_copyright_line(target_lines[1]) if len(target_lines) > 1 else None
-    current_meta = _parse_copyright_line(current_lines[1]) if len(current_lines) > 1 else None
-    if current_header == header or current_meta is None or target_meta is None:
+    current_header, header_end = existing
+    current_line = _second_line(current_header)
+    current_meta = _parse_copyright_line(current_line) if current_line is not None else None
+    if current_header == block or current_meta is None or target_meta is None:
         return None
 
     current_year, current_author = current_meta
@@ -180,7 +216,7 @@ def _prepare_body(body: list[str], target_lines: list[str], header: str) -> list
     if current_author != target_author or current_year == target_year:
         return None
 
-    return [*target_lines, *body[end_idx + 1 :]]
+    return block, body[header_end:]
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -235,18 +271,23 @@ def main(argv: Sequence[str] | None = None) -> int:
     author = args.author or default_author
     year = args.year or datetime.now(tz=UTC).year
     project = args.project or project_name
-    contributions = args.contribution or [f"{author} — general maintenance"]
+    contributions = tuple(args.contribution) if args.contribution else (f"{author} — general maintenance",)
     header = build_header(HeaderConfig(author=author, year=year, project=project, contributions=contributions))
     paths = [Path(p) for p in args.paths]
     files = list(_iter_python_files(paths, set(args.exclude)))
     if not files:
         return 0
-    missing = [path for path in files if not _has_header(path.read_text(encoding=ENCODING))]
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        prefixes = dict(zip(files, executor.map(_read_prefix, files), strict=True))
+    missing = [path for path, prefix in prefixes.items() if not _has_header(prefix)]
     if args.check:
         for path in missing:
             LOGGER.info("%s", path)
         return 1 if missing else 0
-    updated = apply_header(files, header)
+    # Files that already open with the exact header would be left untouched, so skip reading them in full.
+    # A prefix shorter than the read limit is the whole file, so those files are not read a second time.
+    complete = {path: prefix for path, prefix in prefixes.items() if len(prefix) < HEADER_SCAN_LIMIT}
+    updated = apply_header(_without_current_header(prefixes, header), header, preloaded=complete)
     for path in updated:
         LOGGER.info("Added header: %s", path)
     return 0
@@ -14,12 +14,6 @@ import tomllib
 from pathlib import Path
 
 
-def _normalize_tag(tag: str) -> str:
-    if tag.startswith("v"):
-        return tag[1:]
-    return tag
-
-
 def validate_tag_matches_version(tag: str, project_root: Path | None = None) -> None:
     """Ensure the provided tag matches the project version in pyproject.toml.
 
@@ -33,7 +27,7 @@ def validate_tag_matches_version(tag: str, project_root: Path | None = None) ->
 
     root = project_root or Path()
     version = tomllib.loads((root / "pyproject.toml").read_text(encoding="utf-8"))["project"]["version"]
-    normalized_tag = _normalize_tag(tag)
+    normalized_tag = tag.removeprefix("v")
 
     if normalized_tag != version:
         msg = f"Tag {normalized_tag} does not match project version {version}"